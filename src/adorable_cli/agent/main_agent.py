@@ -1,5 +1,6 @@
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from agno.agent import Agent
 from agno.models.openai import OpenAILike
@@ -10,13 +11,28 @@ from agno.tools.python import PythonTools
 from agno.tools.reasoning import ReasoningTools
 from agno.tools.shell import ShellTools
 
-from adorable_cli.agent.prompts import AGENT_INSTRUCTIONS, AGENT_ROLE
+from adorable_cli.agent.prompts import AGENT_PROMPT, AGENT_ROLE
 from adorable_cli.agent.policy import ToolPolicy, apply_tool_policy
 from adorable_cli.settings import settings
 from adorable_cli.tools.todo_tools import TodoTools
 from adorable_cli.tools.vision_tool import create_image_understanding_tool
 
 
+def _with_current_date(instructions: str | list[str]) -> Callable[[Agent], str | list[str]]:
+    """Return the static instructions and date the agent's trailing context per run.
+
+    agno renders ``additional_context`` after the model and tool instructions, so
+    the prompt prefix stays identical across runs; ``add_datetime_to_context``
+    would put a microsecond timestamp ahead of the tool instructions instead.
+    """
+
+    def build(agent: Agent) -> str | list[str]:
+        agent.additional_context = f"The current date is {date.today().isoformat()}."
+        return instructions
+
+    return build
+
+
 def create_adorable_agent(
     db: Any = None,
     session_summary_manager: Any = None,
@@ -24,7 +40,7 @@ def create_adorable_agent(
     *,
     name: str = "Adorable Agent",
     role: str = AGENT_ROLE,
-    instructions: list[str] = AGENT_INSTRUCTIONS,
+    instructions: str | list[str] = AGENT_PROMPT,
     tool_policy: ToolPolicy | None = None,
     extra_tools: list[Any] | None = None,
 ) -> Agent:
@@ -67,8 +83,7 @@ def create_adorable_agent(
         ),
         tools=tools,
         role=role,
-        instructions=instructions,
-        add_datetime_to_context=True,
+        instructions=_with_current_date(instructions),
         enable_agentic_state=True,
         add_session_state_to_context=True,
         # memory
@@ -17,38 +17,51 @@ class ToolPolicy:
     @classmethod
     def from_mode(cls, mode: str | None) -> "ToolPolicy":
         normalized = (mode or "").strip().lower()
-        if normalized in {"read-only", "readonly", "read_only", "ro"}:
-            return cls(allow_shell=False, allow_file_write=False, allow_python=False, confirm_file_write=False)
-        if normalized in {"confirm", "ask"}:
-            return cls(confirm_file_write=True)
-        return cls()
-
-
-_FILE_WRITE_TOOL_NAMES = {
-    "save_file",
-    "write_file",
-    "append_file",
-    "delete_file",
-    "remove_file",
-    "move_file",
-    "copy_file",
-    "create_directory",
-    "delete_directory",
-    "remove_directory",
-    "make_directory",
-    "mkdir",
-    "rmdir",
+        return _MODE_POLICIES.get(normalized) or cls()
+
+
+_READ_ONLY_POLICY = ToolPolicy(
+    allow_shell=False, allow_file_write=False, allow_python=False, confirm_file_write=False
+)
+_CONFIRM_POLICY = ToolPolicy(confirm_file_write=True)
+
+# Policies are frozen, so one shared instance per mode alias is enough.
+_MODE_POLICIES: dict[str, ToolPolicy] = {
+    **dict.fromkeys(("read-only", "readonly", "read_only", "ro"), _READ_ONLY_POLICY),
+    **dict.fromkeys(("confirm", "ask"), _CONFIRM_POLICY),
 }
 
 
+_FILE_WRITE_TOOL_NAMES = frozenset(
+    {
+        "save_file",
+        "write_file",
+        "append_file",
+        "delete_file",
+        "remove_file",
+        "move_file",
+        "copy_file",
+        "create_directory",
+        "delete_directory",
+        "remove_directory",
+        "make_directory",
+        "mkdir",
+        "rmdir",
+    }
+)
+
+
 def apply_tool_policy(agent: object, policy: ToolPolicy) -> None:
     current_tools = getattr(agent, "tools", []) or []
     tools = list(current_tools)
 
+    removed: tuple[type, ...] = ()
     if not policy.allow_shell:
-        tools = [t for t in tools if not isinstance(t, ShellTools)]
+        removed += (ShellTools,)
     if not policy.allow_python:
-        tools = [t for t in tools if not isinstance(t, PythonTools)]
+        removed += (PythonTools,)
+    if removed:
+        tools = [t for t in tools if not isinstance(t, removed)]
 
     for tk in tools:
         functions = getattr(tk, "functions", None)
@@ -64,17 +77,15 @@ def apply_tool_policy(agent: object, policy: ToolPolicy) -> None:
                     pass
 
         if isinstance(tk, FileTools):
+            # Only visit the write tools this toolkit actually registered.
+            write_names = _FILE_WRITE_TOOL_NAMES.intersection(functions)
             if not policy.allow_file_write:
-                for name in list(functions.keys()):
-                    if name in _FILE_WRITE_TOOL_NAMES:
-                        functions.pop(name, None)
+                for name in write_names:
+                    del functions[name]
             elif policy.confirm_file_write:
-                for name in _FILE_WRITE_TOOL_NAMES:
-                    f = functions.get(name)
-                    if f is None:
-                        continue
+                for name in write_names:
                     try:
-                        setattr(f, "requires_confirmation", True)
+                        setattr(functions[name], "requires_confirmation", True)
                     except Exception:
                         pass
 
@@ -4,19 +4,32 @@ Integrates with the prompt engineering system for aggressive conciseness
 and Claude Code-style prompting techniques.
 """
 
-from adorable_cli.prompts.engineering import PromptEngineer, PromptStyle
-from adorable_cli.prompts.templates import (
-    get_system_prompt,
-    get_error_prompt,
-    get_recovery_prompt,
-    compress_for_emergency,
-)
-from adorable_cli.prompts.psychological import (
-    ConfidenceCalibrator,
-    UncertaintyHandler,
-    ErrorFraming,
-    get_never_guess_prompt,
-)
+import importlib
+import textwrap
+from typing import Any
+
+# Names re-exported from the adorable_cli.prompts package. They resolve on first
+# access so importing the agent's prompt constants does not load that package too.
+_PROMPTS_REEXPORTS = {
+    "PromptEngineer": "adorable_cli.prompts.engineering",
+    "PromptStyle": "adorable_cli.prompts.engineering",
+    "get_system_prompt": "adorable_cli.prompts.templates",
+    "get_error_prompt": "adorable_cli.prompts.templates",
+    "get_recovery_prompt": "adorable_cli.prompts.templates",
+    "compress_for_emergency": "adorable_cli.prompts.templates",
+    "ConfidenceCalibrator": "adorable_cli.prompts.psychological",
+    "UncertaintyHandler": "adorable_cli.prompts.psychological",
+    "ErrorFraming": "adorable_cli.prompts.psychological",
+    "get_never_guess_prompt": "adorable_cli.prompts.psychological",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _PROMPTS_REEXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 # Legacy prompts maintained for backward compatibility
 
@@ -76,105 +89,32 @@ Never guess—verify assumptions by reading files or running commands.
     """
 ## Critical Tool Usage Rules (High Priority)
 
-1. **Exact Name Matching**
-   - You MUST use the EXACT tool name as defined.
-   - Tool names are atomic symbols.
-
-2. **No Tool Hallucination**
-   - Do NOT invent tools.
-   - Do NOT modify or extend tool names.
-
-3. **No Tool-Name Composition**
-   - NEVER concatenate or prefix tool names.
-   - Invalid examples include:
-     - thinklist_files
-     - analyzeread_file
-     - toolread_file
-   - Only call ONE exact tool name per invocation.
-
-4. **Reasoning Tools Are Independent**
-   - `think(...)` and `analyze(...)` are standalone tools.
-   - They are NEVER combined with action tools.
-
-5. **Action Fields Are Natural Language Only**
-   - In `think(title, thought, action, confidence)`:
-     - The `action` field is DESCRIPTIVE TEXT ONLY.
-     - It MUST NOT contain tool names.
-     - It MUST NOT resemble a tool name.
-
-6. **Single Tool Call Per Step**
-   - Each tool call must invoke exactly ONE tool with exactly ONE argument object.
+1. **Exact names only**: call tools by their EXACT defined names. Never invent, modify,
+   extend, prefix, or concatenate tool names (invalid: thinklist_files, analyzeread_file).
+2. **One tool per step**: each call invokes exactly ONE tool with exactly ONE argument object.
+   `think` and `analyze` are standalone tools, never combined with action tools.
+3. **Action fields are natural language**: in `think(title, thought, action, confidence)`,
+   `action` is descriptive text and MUST NOT contain or resemble a tool name.
     """,
     """
 ## Available Tools (Exact Names Only)
 
-### Reasoning Tools
-- think
-- analyze
-
-### FileTools
-- list_files
-- read_file
-- read_file_chunk
-- save_file
-- replace_file_chunk
-- search_files
-
-### ShellTools
-- run_shell_command
-
-### PythonTools
-- run_python_code
-
-### Web & Search Tools
-- duckduckgo_search
-- duckduckgo_news
-- fetch
-
-### Playwright Tools
-- browser_close
-- browser_resize
-- browser_console_messages
-- browser_handle_dialog
-- browser_evaluate
-- browser_file_upload
-- browser_fill_form
-- browser_install
-- browser_press_key
-- browser_type
-- browser_navigate
-- browser_navigate_back
-- browser_network_requests
-- browser_run_code
-- browser_take_screenshot
-- browser_snapshot
-- browser_click
-- browser_drag
-- browser_hover
-- browser_select_option
-- browser_tabs
-- browser_wait_for
-
-### Image Tools
-- analyze_image
-
-### Todo Tools
-- add_todo
-- list_todos
-- complete_todo
-- remove_todo
+- Reasoning: think, analyze
+- FileTools: list_files, read_file, read_file_chunk, save_file, replace_file_chunk, search_files
+- ShellTools: run_shell_command
+- PythonTools: run_python_code
+- Web & Search: duckduckgo_search, duckduckgo_news, fetch
+- Playwright: browser_close, browser_resize, browser_console_messages, browser_handle_dialog,
+  browser_evaluate, browser_file_upload, browser_fill_form, browser_install, browser_press_key,
+  browser_type, browser_navigate, browser_navigate_back, browser_network_requests,
+  browser_run_code, browser_take_screenshot, browser_snapshot, browser_click, browser_drag,
+  browser_hover, browser_select_option, browser_tabs, browser_wait_for
+- Image: analyze_image
+- Todo: add_todo, list_todos, complete_todo, remove_todo
 
 Only the tool names listed above are valid.
     """,
     """
-## Usage Guidelines
-
-- Use `think` to plan the next step or reflect on errors.
-- Use an action tool to perform exactly one concrete operation.
-- Use `analyze` to interpret tool output and decide what to do next.
-- If unsure, reason first. Never guess.
-    """,
-    """
 ## Example Workflow
 
 STEP 1 — REASONING TOOL:
@@ -210,6 +150,9 @@ Final output must be same language as the user input.
     """,
 ]
 
+# Dedented and joined once at import; the agent receives it as one instruction block.
+AGENT_PROMPT = "\n\n".join(textwrap.dedent(block).strip() for block in AGENT_INSTRUCTIONS)
+
 VLM_AGENT_DESCRIPTION = "A specialized agent for understanding images and visual content."
 
 VLM_AGENT_INSTRUCTIONS = [
@@ -1,12 +1,10 @@
 import os
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
-from rich.panel import Panel
-from rich.text import Text
-
-from adorable_cli.console import console
+from adorable_cli.console import get_console
 
 CONFIG_PATH = Path(os.environ.get("ADORABLE_HOME", Path.home() / ".adorable"))
 CONFIG_FILE = CONFIG_PATH / "config"
@@ -20,10 +18,28 @@ def sanitize(val: str) -> str:
     return val.strip().strip('"').strip("'").strip("`")
 
 
+# Flat config parsed from each file, keyed by path with the file_stamp it was parsed at.
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict[str, str] | None]] = {}
+
+
+def file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for change detection, or None if the file is unreadable."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def parse_kv_file(path: Path) -> dict[str, str]:
+    stamp = file_stamp(path)
+    if stamp is None:
+        return {}
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
     cfg: dict[str, str] = {}
-    if not path.exists():
-        return cfg
     for line in path.read_text(encoding="utf-8").splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
@@ -31,13 +47,24 @@ def parse_kv_file(path: Path) -> dict[str, str]:
         if "=" in line:
             k, v = line.split("=", 1)
             # Strip common quotes/backticks users may include
-            cfg[k.strip()] = v.strip().strip('"').strip("'").strip("`")
-    return cfg
+            # Keys are looked up repeatedly by name; intern them once while parsing.
+            cfg[sys.intern(k.strip())] = v.strip().strip('"').strip("'").strip("`")
+    _CONFIG_CACHE[path] = (stamp, cfg)
+    return dict(cfg)
+
+
+def invalidate_config_cache(path: Path | None = None) -> None:
+    """Drop cached parses for ``path`` (or all files when omitted)."""
+    if path is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(path, None)
 
 
 def write_kv_file(path: Path, data: dict[str, str]) -> None:
     lines = [f"{k}={v}" for k, v in data.items()]
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    invalidate_config_cache(path)
 
 
 def parse_json_file(path: Path) -> dict[str, Any]:
@@ -54,6 +81,7 @@ def parse_json_file(path: Path) -> dict[str, Any]:
 
 def write_json_file(path: Path, data: dict[str, Any]) -> None:
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    invalidate_config_cache(path)
 
 
 def _get_nested(cfg: dict[str, Any], path: list[str]) -> Any:
@@ -132,17 +160,32 @@ def materialize_json_config(flat_cfg: dict[str, str]) -> dict[str, Any]:
 
 
 def read_config() -> dict[str, str]:
-    if CONFIG_JSON_FILE.exists():
-        raw = parse_json_file(CONFIG_JSON_FILE)
-        if raw:
-            return normalize_config(raw)
+    stamp = file_stamp(CONFIG_JSON_FILE)
+    if stamp is not None:
+        cached = _CONFIG_CACHE.get(CONFIG_JSON_FILE)
+        if cached is not None and cached[0] == stamp:
+            flat = cached[1]
+        else:
+            raw = parse_json_file(CONFIG_JSON_FILE)
+            # None: empty or unreadable JSON, so the legacy file still applies.
+            flat = normalize_config(raw) if raw else None
+            _CONFIG_CACHE[CONFIG_JSON_FILE] = (stamp, flat)
+        if flat is not None:
+            return dict(flat)
     return parse_kv_file(CONFIG_FILE)
 
 
+# Config roots whose directory layout has already been created in this process.
+_LAYOUT_READY: set[Path] = set()
+
+
 def ensure_user_layout() -> None:
+    if CONFIG_PATH in _LAYOUT_READY:
+        return
     CONFIG_PATH.mkdir(parents=True, exist_ok=True)
     for name in USER_DIR_NAMES:
         (CONFIG_PATH / name).mkdir(parents=True, exist_ok=True)
+    _LAYOUT_READY.add(CONFIG_PATH)
 
 
 def write_config(flat_cfg: dict[str, str]) -> None:
@@ -201,6 +244,10 @@ def load_env_from_config(cfg: dict[str, str]) -> None:
 
 
 def ensure_config_interactive() -> dict[str, str]:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
     # Ensure configuration directory exists and read existing config if present
     ensure_user_layout()
     cfg = read_config()
@@ -258,6 +305,10 @@ def load_config_silent() -> None:
 
 
 def run_config() -> int:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
     console.print(
         Panel(
             "Configure API_KEY, BASE_URL, MODEL_ID, VLM_MODEL_ID, FAST_MODEL_ID",
@@ -1,3 +1,5 @@
+import sys
+
 from rich.console import Console
 from rich.theme import Theme
 
@@ -24,9 +26,18 @@ _APP_THEME = Theme(
 console = Console(theme=_APP_THEME)
 
 
-def configure_console(plain: bool) -> None:
+def configure_console(plain: bool) -> Console:
     global console
-    if plain:
-        console = Console(no_color=True)
+    # sys.stdout is None under pythonw or when the stream was detached.
+    isatty = getattr(sys.stdout, "isatty", None)
+    if plain or isatty is None or not isatty():
+        # Keep the theme so named styles still resolve; only drop color and highlighting.
+        console = Console(theme=_APP_THEME, no_color=True, highlight=False, soft_wrap=True)
     else:
         console = Console(theme=_APP_THEME)
+    return console
+
+
+def get_console() -> Console:
+    """Return the active console, including any rebinding by configure_console."""
+    return console
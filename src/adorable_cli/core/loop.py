@@ -272,6 +272,7 @@ class AgentLoop:
         - Thinking/reasoning content
         """
         accumulator = self._turn_state.accumulator
+        turn_id = str(self._turn_state.turn_number)
         self._json_parser = None
 
         async for event in stream:
@@ -285,7 +286,7 @@ class AgentLoop:
                     yield ContentDeltaEvent(
                         delta=content,
                         accumulated=accumulator.text_buffer,
-                        turn_id=str(self._turn_state.turn_number),
+                        turn_id=turn_id,
                     )
 
             # Handle tool calls starting
@@ -315,7 +316,7 @@ class AgentLoop:
                         tool_use_id=tool_use_id,
                         tool_name=tool_name,
                         partial_input="",
-                        turn_id=str(self._turn_state.turn_number),
+                        turn_id=turn_id,
                     )
 
             # Handle thinking/reasoning content
@@ -325,7 +326,7 @@ class AgentLoop:
                     yield ThinkingDeltaEvent(
                         delta=thinking,
                         accumulated=thinking,
-                        turn_id=str(self._turn_state.turn_number),
+                        turn_id=turn_id,
                     )
 
             # Handle completion
@@ -349,7 +350,7 @@ class AgentLoop:
                             tool_use_id=self._current_tool_use.id,
                             tool_name=self._current_tool_use.name,
                             tool_input=parsed,
-                            turn_id=str(self._turn_state.turn_number),
+                            turn_id=turn_id,
                         )
 
                 usage = None
@@ -363,7 +364,7 @@ class AgentLoop:
                     content=content,
                     stop_reason="end_turn",
                     usage=usage,
-                    turn_id=str(self._turn_state.turn_number),
+                    turn_id=turn_id,
                 )
 
     # ========================================================================
@@ -383,6 +384,8 @@ class AgentLoop:
         if not tool_calls:
             return
 
+        turn_id = str(self._turn_state.turn_number)
+
         # Categorize tool calls
         read_only_calls: list[ToolUseBlock] = []
         write_calls: list[ToolUseBlock] = []
@@ -405,7 +408,7 @@ class AgentLoop:
                     tool_name=tool.name,
                     tool_input=tool.input,
                     reason="Potentially destructive operation",
-                    turn_id=str(self._turn_state.turn_number),
+                    turn_id=turn_id,
                 )
                 yield confirm_event
 
@@ -417,7 +420,7 @@ class AgentLoop:
                         result="",
                         is_error=True,
                         error_message="User declined to run this tool",
-                        turn_id=str(self._turn_state.turn_number),
+                        turn_id=turn_id,
                     )
                     continue
 
@@ -455,13 +458,14 @@ class AgentLoop:
         tool_use_id = tool.id
         tool_name = tool.name
         tool_input = tool.input
+        turn_id = str(self._turn_state.turn_number)
 
         start_time = datetime.now()
 
         yield ToolExecutionStartEvent(
             tool_use_id=tool_use_id,
             tool_name=tool_name,
-            turn_id=str(self._turn_state.turn_number),
+            turn_id=turn_id,
         )
 
         try:
@@ -478,7 +482,7 @@ class AgentLoop:
                 result=result,
                 is_error=False,
                 execution_time_ms=execution_time,
-                turn_id=str(self._turn_state.turn_number),
+                turn_id=turn_id,
             )
 
         except Exception as e:
@@ -493,7 +497,7 @@ class AgentLoop:
                 is_error=True,
                 error_message=str(e),
                 execution_time_ms=execution_time,
-                turn_id=str(self._turn_state.turn_number),
+                turn_id=turn_id,
             )
 
     async def _invoke_tool(
@@ -520,9 +524,9 @@ class AgentLoop:
 
         # Check for forbidden commands in shell operations
         if tool_name == "run_shell_command":
-            command = tool_input.get("command", "")
+            command = tool_input.get("command", "").lower()
             for forbidden in self.config.forbidden_commands:
-                if forbidden in command.lower():
+                if forbidden in command:
                     raise RuntimeError(
                         f"Forbidden command detected: {forbidden}"
                     )
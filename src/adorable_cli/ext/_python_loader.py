@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 from typing import Any, Iterable
 
+from adorable_cli.config import file_stamp
+
 
 def iter_python_files(directory: Path) -> Iterable[Path]:
     if not directory.exists():
@@ -21,6 +23,14 @@ def iter_python_files(directory: Path) -> Iterable[Path]:
 def load_module_from_path(path: Path) -> Any | None:
     module_key = hashlib.sha1(str(path).encode("utf-8")).hexdigest()
     module_name = f"adorable_cli.ext.user_{module_key}"
+    stamp = file_stamp(path)
+    if stamp is None:
+        return None
+    # Reuse the already-executed module unless the file changed on disk.
+    cached = sys.modules.get(module_name)
+    if cached is not None and getattr(cached, "__adorable_stamp__", None) == stamp:
+        return cached
+
     spec = importlib.util.spec_from_file_location(module_name, path)
     if spec is None or spec.loader is None:
         return None
@@ -31,6 +41,7 @@ def load_module_from_path(path: Path) -> Any | None:
     except Exception:
         sys.modules.pop(module_name, None)
         return None
+    module.__adorable_stamp__ = stamp
     return module
 
 
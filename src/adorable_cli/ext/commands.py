@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml
-except Exception:  # pragma: no cover - optional dependency fallback
-    yaml = None
+from adorable_cli.config import file_stamp
+
+
+@functools.cache
+def _yaml_loader() -> tuple[Any, Any] | None:
+    """Import PyYAML on first use; most sessions never read a YAML command."""
+    try:
+        import yaml
+    except Exception:  # pragma: no cover - optional dependency fallback
+        return None
+    # Prefer libyaml's C loader when PyYAML was built with it; same safe semantics.
+    return yaml, getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
 
 
 @dataclass(frozen=True)
@@ -19,6 +29,15 @@ class CommandDefinition:
     source_path: Path | None = None
 
 
+# Parsed structured command files, keyed by path with the file_stamp they were parsed at.
+_STRUCTURED_CACHE: dict[Path, tuple[tuple[int, int], tuple[CommandDefinition, ...]]] = {}
+
+
+def _as_text(value: Any) -> str:
+    # YAML/JSON values are usually str already; only coerce other scalars.
+    return (value if isinstance(value, str) else str(value)).strip()
+
+
 class CommandsLoader:
     """Load custom slash commands from a directory."""
 
@@ -29,10 +48,13 @@ class CommandsLoader:
         if not self.directory.exists():
             return {}
 
+        # DirEntry caches the file type from readdir, so no extra stat per entry.
+        with os.scandir(self.directory) as it:
+            names = sorted(e.name for e in it if not e.name.startswith(".") and not e.is_dir())
+
         commands: dict[str, CommandDefinition] = {}
-        for path in sorted(self.directory.iterdir()):
-            if path.is_dir() or path.name.startswith("."):
-                continue
+        for name in names:
+            path = self.directory / name
 
             items = []
             if path.suffix.lower() in {".json", ".yaml", ".yml"}:
@@ -57,6 +79,18 @@ class CommandsLoader:
         return CommandDefinition(name=path.stem, prompt=prompt, source_path=path)
 
     def _load_structured(self, path: Path) -> list[CommandDefinition]:
+        stamp = file_stamp(path)
+        if stamp is None:
+            return []
+        cached = _STRUCTURED_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return list(cached[1])
+
+        commands = self._parse_structured(path)
+        _STRUCTURED_CACHE[path] = (stamp, tuple(commands))
+        return commands
+
+    def _parse_structured(self, path: Path) -> list[CommandDefinition]:
         try:
             raw = path.read_text(encoding="utf-8")
         except Exception:
@@ -69,10 +103,11 @@ class CommandsLoader:
             except Exception:
                 return []
         else:
-            if yaml is None:
+            if (loader := _yaml_loader()) is None:
                 return []
+            yaml, yaml_loader = loader
             try:
-                data = yaml.safe_load(raw)
+                data = yaml.load(raw, Loader=yaml_loader)
             except Exception:
                 return []
 
@@ -100,9 +135,8 @@ class CommandsLoader:
         if not isinstance(mapping, dict):
             return None
 
-        name = str(mapping.get("name") or mapping.get("command") or path.stem).strip()
-        prompt = mapping.get("prompt")
-        if prompt is None:
+        name = _as_text(mapping.get("name") or mapping.get("command") or path.stem)
+        if (prompt := mapping.get("prompt")) is None:
             prompt = mapping.get("text") or mapping.get("instruction") or mapping.get("template")
 
         if isinstance(prompt, list):
@@ -110,13 +144,12 @@ class CommandsLoader:
         if prompt is None:
             return None
 
-        prompt_text = str(prompt).strip()
+        prompt_text = _as_text(prompt)
         if not name or not prompt_text:
             return None
 
-        description = mapping.get("description") or mapping.get("desc")
-        if description is not None:
-            description = str(description).strip() or None
+        if (description := mapping.get("description") or mapping.get("desc")) is not None:
+            description = _as_text(description) or None
 
         return CommandDefinition(
             name=name,
@@ -1,31 +1,39 @@
 import asyncio
 import os
-from typing import Optional
+import sys
+from typing import Callable, Optional
 
-import httpx
 import typer
 
-from adorable_cli.agent.builder import build_component, configure_logging
 from adorable_cli.config import ensure_config_interactive, load_config_silent, run_config
 from adorable_cli.console import configure_console
 from adorable_cli.settings import reload_settings, settings
-from adorable_cli.ui.interactive import print_version, run_interactive
 
-app = typer.Typer(add_completion=False)
-teams_app = typer.Typer(add_completion=False)
+# The agent builder and interactive UI pull in agno/openai/prompt_toolkit; they are
+# imported inside the commands that need them so `version`, `config`, etc. start fast.
+
+# Plain Click help/error rendering avoids importing Typer's Rich formatting layer.
+_TYPER_OPTIONS = {
+    "add_completion": False,
+    "rich_markup_mode": None,
+    "context_settings": {"help_option_names": ["-h", "--help"]},
+}
+
+app = typer.Typer(**_TYPER_OPTIONS)
+teams_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(teams_app, name="teams")
-workflows_app = typer.Typer(add_completion=False)
-workflow_app = typer.Typer(add_completion=False)
+workflows_app = typer.Typer(**_TYPER_OPTIONS)
+workflow_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(workflows_app, name="workflows")
 app.add_typer(workflow_app, name="workflow")
 
-kb_app = typer.Typer(add_completion=False)
+kb_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(kb_app, name="kb")
 
-eval_app = typer.Typer(add_completion=False)
+eval_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(eval_app, name="eval")
 
-db_app = typer.Typer(add_completion=False)
+db_app = typer.Typer(**_TYPER_OPTIONS)
 app.add_typer(db_app, name="db")
 
 
@@ -198,6 +206,9 @@ def _run_async(coro):
         raise RuntimeError("Cannot start CLI loop from a running event loop")
 
 
+# Subcommands that never read config or CLI overrides from the environment.
+_ENV_FREE_COMMANDS = frozenset({"version"})
+
 
 @app.callback(invoke_without_command=True)
 def app_entry(
@@ -213,26 +224,34 @@ def app_entry(
     session_id: Optional[str] = typer.Option(None, "--session-id"),
     user_id: Optional[str] = typer.Option(None, "--user-id"),
 ) -> None:
+    configure_console(plain)
+    if ctx.invoked_subcommand in _ENV_FREE_COMMANDS:
+        return
+
     load_config_silent()
 
+    overrides: dict[str, str] = {}
+    defaults: dict[str, str] = {}
     if api_key:
-        os.environ["OPENAI_API_KEY"] = api_key
-        os.environ.setdefault("API_KEY", api_key)
+        overrides["OPENAI_API_KEY"] = defaults["API_KEY"] = api_key
     if base_url:
-        os.environ["OPENAI_BASE_URL"] = base_url
-        os.environ.setdefault("BASE_URL", base_url)
+        overrides["OPENAI_BASE_URL"] = defaults["BASE_URL"] = base_url
     if model:
-        os.environ["DEEPAGENTS_MODEL_ID"] = model
+        overrides["DEEPAGENTS_MODEL_ID"] = model
     if fast_model:
-        os.environ["DEEPAGENTS_FAST_MODEL_ID"] = fast_model
+        overrides["DEEPAGENTS_FAST_MODEL_ID"] = fast_model
     if debug:
-        os.environ["AGNO_DEBUG"] = "1"
+        overrides["AGNO_DEBUG"] = "1"
     if debug_level is not None:
-        os.environ["AGNO_DEBUG_LEVEL"] = str(debug_level)
-
-    configure_console(plain)
+        overrides["AGNO_DEBUG_LEVEL"] = str(debug_level)
+    os.environ.update(overrides)
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
 
     if ctx.invoked_subcommand is None:
+        from adorable_cli.agent.builder import build_component, configure_logging
+        from adorable_cli.ui.interactive import run_interactive
+
         ensure_config_interactive()
         reload_settings()
         configure_logging()
@@ -246,6 +265,8 @@ def app_entry(
 
 @app.command()
 def version() -> None:
+    from adorable_cli.ui.interactive import print_version
+
     code = print_version()
     raise typer.Exit(code)
 
@@ -262,6 +283,9 @@ def chat(
     user_id: Optional[str] = typer.Option(None, "--user-id"),
     team: Optional[str] = typer.Option(None, "--team"),
 ) -> None:
+    from adorable_cli.agent.builder import build_component, configure_logging
+    from adorable_cli.ui.interactive import run_interactive
+
     ensure_config_interactive()
     reload_settings()
     configure_logging()
@@ -280,6 +304,8 @@ def serve(
     reload: bool = typer.Option(False, "--reload"),
     check: bool = typer.Option(False, "--check"),
 ) -> None:
+    from adorable_cli.agent.builder import configure_logging
+
     ensure_config_interactive()
     reload_settings()
     configure_logging()
@@ -293,6 +319,8 @@ def serve(
         os.environ["ADORABLE_SERVER_PORT"] = str(port)
 
     if check:
+        import httpx
+
         from adorable_cli.os.server import create_agent_os
 
         agent_os = create_agent_os()
@@ -352,6 +380,7 @@ def attach(
         from agno.db.base import SessionType
 
         from adorable_cli.os.remote_agent import RemoteAgent
+        from adorable_cli.ui.interactive import run_interactive
 
         base_url = url.strip()
         if "://" not in base_url:
@@ -476,7 +505,29 @@ def workflow_run(
     raise typer.Exit(code)
 
 
+def _fast_version() -> int:
+    from adorable_cli.ui.interactive import print_version
+
+    return print_version()
+
+
+# Exact argv patterns answered without building the Typer/Click command tree.
+_FAST_PATHS: dict[tuple[str, ...], Callable[[], int]] = {
+    ("version",): _fast_version,
+}
+
+
+def _dispatch_fast_path(argv: list[str]) -> Optional[int]:
+    handler = _FAST_PATHS.get(tuple(argv))
+    if handler is None:
+        return None
+    return handler()
+
+
 def main() -> int:
+    code = _dispatch_fast_path(sys.argv[1:])
+    if code is not None:
+        return code
     app()
     return 0
 
@@ -24,6 +24,14 @@ class MemoryPriority(Enum):
     LOW = 1       # General information
 
 
+_PRIORITY_MARKERS: dict[MemoryPriority, str] = {
+    MemoryPriority.CRITICAL: "🔴",
+    MemoryPriority.HIGH: "🟠",
+    MemoryPriority.MEDIUM: "🟡",
+    MemoryPriority.LOW: "🟢",
+}
+
+
 @dataclass
 class MemoryItem:
     """A single item in working memory."""
@@ -245,12 +253,7 @@ class WorkingMemory:
         for category, cat_items in by_category.items():
             parts.append(f"\n### {category.title()}")
             for item in cat_items:
-                priority_marker = {
-                    MemoryPriority.CRITICAL: "🔴",
-                    MemoryPriority.HIGH: "🟠",
-                    MemoryPriority.MEDIUM: "🟡",
-                    MemoryPriority.LOW: "🟢",
-                }.get(item.priority, "⚪")
+                priority_marker = _PRIORITY_MARKERS.get(item.priority, "⚪")
 
                 parts.append(f"{priority_marker} {item.content}")
 
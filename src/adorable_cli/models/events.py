@@ -6,17 +6,27 @@ which drives the UI updates while maintaining conversation flow.
 
 from __future__ import annotations
 
+import itertools
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal, Optional
-from uuid import UUID, uuid4
+
+# Event ids only need to be unique, not random: one random per-process tag plus a
+# counter avoids a uuid4() (urandom read + formatting) for every streamed delta.
+_EVENT_ID_TAG = secrets.token_hex(4)
+_event_counter = itertools.count()
+
+
+def _next_event_id() -> str:
+    return f"{_EVENT_ID_TAG}-{next(_event_counter):x}"
 
 
 @dataclass
 class StreamEvent:
     """Base class for all stream events."""
 
-    event_id: str = field(default_factory=lambda: str(uuid4()))
+    event_id: str = field(default_factory=_next_event_id)
     timestamp: datetime = field(default_factory=datetime.now)
     turn_id: Optional[str] = None
 
@@ -18,7 +18,8 @@ class RemoteAgent:
         self.agent_id = agent_id
         self.session_id = session_id
         self.user_id = user_id
-        self.headers = headers
+        # Normalized once: a private copy, or None so clients can take their no-header path.
+        self.headers = dict(headers) if headers else None
 
     async def arun(self, *args: Any, **kwargs: Any) -> Iterable[Any]:
         """Placeholder async run for compatibility with run_interactive."""
@@ -82,6 +82,14 @@ class ConcisenessEnforcer:
         r"\bjust\s+",
     ]
 
+    # Each list compiled once as a single alternation: one scan per list per call.
+    _FILLER_RE = re.compile("|".join(FILLER_PATTERNS), re.IGNORECASE)
+    _QUALIFIER_RE = re.compile("|".join(REDUNDANT_QUALIFIERS), re.IGNORECASE)
+    _YOU_SHOULD_RE = re.compile(r"\byou\s+should\s+", re.IGNORECASE)
+    _EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+    # Whitespace other than "\n" at the end of each line (same set str.rstrip strips).
+    _TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
     @classmethod
     def enforce(cls, text: str, aggressive: bool = True) -> str:
         """Enforce conciseness on text.
@@ -93,31 +101,21 @@ class ConcisenessEnforcer:
         Returns:
             Concise version of text
         """
-        result = text
-
         # Remove filler phrases
-        for pattern in cls.FILLER_PATTERNS:
-            result = re.sub(pattern, "", result, flags=re.IGNORECASE)
+        result = cls._FILLER_RE.sub("", text)
 
         if aggressive:
             # Remove redundant qualifiers
-            for pattern in cls.REDUNDANT_QUALIFIERS:
-                result = re.sub(pattern, "", result, flags=re.IGNORECASE)
+            result = cls._QUALIFIER_RE.sub("", result)
 
             # Convert "You should X" -> "X"
-            result = re.sub(
-                r"\byou\s+should\s+",
-                "",
-                result,
-                flags=re.IGNORECASE
-            )
+            result = cls._YOU_SHOULD_RE.sub("", result)
 
             # Remove excessive newlines
-            result = re.sub(r"\n{3,}", "\n\n", result)
+            result = cls._EXCESS_NEWLINES_RE.sub("\n\n", result)
 
             # Remove trailing whitespace
-            lines = [line.rstrip() for line in result.split("\n")]
-            result = "\n".join(lines)
+            result = cls._TRAILING_WS_RE.sub("", result)
 
         return result.strip()
 
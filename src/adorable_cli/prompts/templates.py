@@ -8,6 +8,7 @@ Implements Claude Code's principles:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
@@ -26,6 +27,17 @@ def get_system_prompt(
     Returns:
         System prompt string
     """
+    prompt = _static_system_prompt(role, enable_reasoning)
+
+    # Context information goes last so the static sections form a stable prefix
+    if context_info:
+        return f"{prompt}\n\n{_format_context(context_info)}"
+    return prompt
+
+
+@lru_cache(maxsize=16)
+def _static_system_prompt(role: str, enable_reasoning: bool) -> str:
+    """Assemble the context-independent sections once per (role, reasoning) pair."""
     parts = []
 
     # Core identity - minimal
@@ -38,37 +50,34 @@ def get_system_prompt(
     # Critical rules - repeated for emphasis
     parts.append(_get_critical_rules())
 
-    # Context information
-    if context_info:
-        parts.append(_format_context(context_info))
-
     # Completion rule
     parts.append(_get_completion_rule())
 
     return "\n\n".join(parts)
 
 
-def _get_identity(role: str) -> str:
-    """Get identity section."""
-    identities = {
-        "autonomous_agent": """# Adorable
+_IDENTITIES = {
+    "autonomous_agent": """# Adorable
 
 Autonomous CLI agent. File system, shell, Python access. Operate in working directory.""",
 
-        "file_editor": """# File Editor
+    "file_editor": """# File Editor
 
 Edit files with precision. Read before edit. Verify after.""",
 
-        "researcher": """# Research Agent
+    "researcher": """# Research Agent
 
 Find information. Use search tools. Cite sources.""",
 
-        "debugger": """# Debug Agent
+    "debugger": """# Debug Agent
 
 Diagnose issues methodically. Never guess. Verify causes.""",
-    }
+}
+
 
-    return identities.get(role, identities["autonomous_agent"])
+def _get_identity(role: str) -> str:
+    """Get identity section."""
+    return _IDENTITIES.get(role, _IDENTITIES["autonomous_agent"])
 
 
 def _get_reasoning_mode() -> str:
@@ -164,6 +173,13 @@ Reasoning: think, analyze"""
     return "\n".join(lines)
 
 
+_ERROR_TYPE_HINTS = {
+    "tool": "Tool error. Check name and arguments.",
+    "format": "Format error. Check JSON/tool format.",
+    "validation": "Validation error. Check parameters.",
+}
+
+
 def get_error_prompt(
     error: str,
     error_type: str = "general",
@@ -183,12 +199,9 @@ def get_error_prompt(
     """
     parts = ["ERROR. Fix and continue."]
 
-    if error_type == "tool":
-        parts.append("Tool error. Check name and arguments.")
-    elif error_type == "format":
-        parts.append("Format error. Check JSON/tool format.")
-    elif error_type == "validation":
-        parts.append("Validation error. Check parameters.")
+    type_hint = _ERROR_TYPE_HINTS.get(error_type)
+    if type_hint:
+        parts.append(type_hint)
 
     parts.append(f"Error: {error}")
 
@@ -352,7 +352,7 @@ class AgentTool:
         """Execute a single sub-agent task."""
         import time
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Create sub-agent with filtered context
@@ -362,7 +362,7 @@ class AgentTool:
             # This would integrate with your actual agent framework
             output = await self._run_agent(sub_agent, task)
 
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = int((time.monotonic() - start_time) * 1000)
 
             return SubAgentResult(
                 task_id=task.task_id,
@@ -373,7 +373,7 @@ class AgentTool:
             )
 
         except Exception as e:
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = int((time.monotonic() - start_time) * 1000)
 
             return SubAgentResult(
                 task_id=task.task_id,
@@ -432,24 +432,10 @@ class AgentTool:
             tool_name="AgentTool",
         )
 
-        for i, task in enumerate(sub_tasks):
-            yield ContentDeltaEvent(
-                delta=f"\n[Starting sub-agent {task.config.name}...]\n",
-                accumulated=f"",
-            )
-
+        for task in sub_tasks:
+            yield self._sub_agent_started(task)
             result = await self._execute_sub_agent(task, 100_000)
-
-            if result.success:
-                yield ContentDeltaEvent(
-                    delta=f"[Completed: {result.output[:200]}...]\n",
-                    accumulated=result.output,
-                )
-            else:
-                yield ContentDeltaEvent(
-                    delta=f"[Error: {result.error_message}]\n",
-                    accumulated="",
-                )
+            yield self._sub_agent_finished(task, result)
 
         # Final synthesis
         yield ContentDeltaEvent(
@@ -457,6 +443,26 @@ class AgentTool:
             accumulated="",
         )
 
+    @staticmethod
+    def _sub_agent_started(task: SubAgentTask) -> ContentDeltaEvent:
+        return ContentDeltaEvent(
+            delta=f"\n[Starting sub-agent {task.config.name} ({task.task_id})...]\n",
+            accumulated="",
+        )
+
+    @staticmethod
+    def _sub_agent_finished(task: SubAgentTask, result: SubAgentResult) -> ContentDeltaEvent:
+        label = f"{task.config.name} ({task.task_id})"
+        if result.success:
+            return ContentDeltaEvent(
+                delta=f"[Completed {label}: {result.output[:200]}...]\n",
+                accumulated=result.output,
+            )
+        return ContentDeltaEvent(
+            delta=f"[Error {label}: {result.error_message}]\n",
+            accumulated="",
+        )
+
 
 class SimpleSubAgent:
     """Simple sub-agent implementation for demonstration.
@@ -18,12 +18,16 @@ Usage:
 from __future__ import annotations
 
 import platform
+import re
 import subprocess
 import tempfile
+import threading
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 class SandboxLevel(Enum):
@@ -60,6 +64,55 @@ class SandboxConfig:
     max_output_size: int = 10 * 1024 * 1024  # 10MB
 
 
+_READ_CHUNK = 64 * 1024
+
+
+def _run_capped(
+    args: Any,
+    *,
+    limit: int,
+    timeout: Optional[float] = None,
+    **popen_kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """Like subprocess.run(capture_output=True, text=True), keeping at most limit chars per stream.
+
+    Output past the limit is read and discarded as it arrives, so a verbose
+    command costs O(limit) memory instead of buffering everything and slicing.
+    Raises subprocess.TimeoutExpired after killing the process, as run() does.
+    """
+    proc = subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, **popen_kwargs
+    )
+    captured: tuple[list[str], list[str]] = ([], [])
+
+    def drain(stream: Any, chunks: list[str]) -> None:
+        kept = 0
+        with stream:
+            for chunk in iter(partial(stream.read, _READ_CHUNK), ""):
+                if kept < limit:
+                    chunks.append(chunk[: limit - kept])
+                    kept += len(chunk)
+
+    readers = [
+        threading.Thread(target=drain, args=(stream, chunks), daemon=True)
+        for stream, chunks in zip((proc.stdout, proc.stderr), captured)
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Don't wait on the pipes: background children may still hold them open.
+        proc.kill()
+        proc.wait()
+        raise
+    for reader in readers:
+        reader.join()
+    return subprocess.CompletedProcess(
+        args, proc.returncode, "".join(captured[0]), "".join(captured[1])
+    )
+
+
 class SandboxProfileGenerator:
     """Generates macOS sandbox-exec profiles.
 
@@ -191,6 +244,7 @@ class BashSandbox:
         self.config = config or SandboxConfig()
         self._is_macos = platform.system() == "Darwin"
         self._profile_file: Optional[Path] = None
+        self._profile_text: Optional[str] = None
 
     def execute(
         self,
@@ -223,12 +277,7 @@ class BashSandbox:
         env: Optional[dict] = None,
     ) -> SandboxResult:
         """Execute using macOS sandbox-exec."""
-        # Generate and write profile
-        profile = SandboxProfileGenerator.generate(self.config)
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sb', delete=False) as f:
-            f.write(profile)
-            profile_path = Path(f.name)
+        profile_path = self._ensure_profile_file()
 
         try:
             # Build sandbox-exec command
@@ -240,12 +289,11 @@ class BashSandbox:
             ]
 
             # Execute with timeout
-            result = subprocess.run(
+            result = _run_capped(
                 cmd,
+                limit=self.config.max_output_size,
                 cwd=cwd,
                 env=env,
-                capture_output=True,
-                text=True,
                 timeout=self.config.timeout_seconds,
             )
 
@@ -273,12 +321,31 @@ class BashSandbox:
         except FileNotFoundError:
             # sandbox-exec not available
             return self._execute_unrestricted(command, cwd, env)
-        finally:
-            # Clean up profile
-            try:
-                profile_path.unlink()
-            except OSError:
-                pass
+
+    def _ensure_profile_file(self) -> Path:
+        """Write the sandbox profile once and reuse it across executions.
+
+        The file is rewritten only when the generated profile changes (e.g. the
+        config was mutated) and is removed when the sandbox is garbage collected
+        or the interpreter exits.
+        """
+        profile = SandboxProfileGenerator.generate(self.config)
+        if (
+            self._profile_file is not None
+            and profile == self._profile_text
+            and self._profile_file.exists()
+        ):
+            return self._profile_file
+
+        if self._profile_file is None:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.sb', delete=False) as f:
+                f.write(profile)
+                self._profile_file = Path(f.name)
+            weakref.finalize(self, self._profile_file.unlink, missing_ok=True)
+        else:
+            self._profile_file.write_text(profile)
+        self._profile_text = profile
+        return self._profile_file
 
     def _execute_sandboxed_linux(
         self,
@@ -294,12 +361,11 @@ class BashSandbox:
         restricted_cmd = f"bash -r -c {repr(command)}"
 
         try:
-            result = subprocess.run(
+            result = _run_capped(
                 restricted_cmd,
+                limit=self.config.max_output_size,
                 cwd=cwd,
                 env=restricted_env,
-                capture_output=True,
-                text=True,
                 shell=True,
                 timeout=self.config.timeout_seconds,
             )
@@ -330,12 +396,11 @@ class BashSandbox:
     ) -> SandboxResult:
         """Execute without sandbox (DANGEROUS)."""
         try:
-            result = subprocess.run(
+            result = _run_capped(
                 command,
+                limit=self.config.max_output_size,
                 cwd=cwd,
                 env=env,
-                capture_output=True,
-                text=True,
                 shell=True,
                 timeout=self.config.timeout_seconds,
             )
@@ -437,6 +502,17 @@ class BashTool:
         (r"\b>\s*/[a-zA-Z]+/", "root filesystem write"),
     ]
 
+    # Compiled once with the class; checked in DANGEROUS_PATTERNS order.
+    _COMPILED_PATTERNS = tuple(
+        (re.compile(pattern, re.IGNORECASE), reason) for pattern, reason in DANGEROUS_PATTERNS
+    )
+
+    # Every pattern above needs one of these substrings (case-insensitively), so
+    # commands without any of them (ls, cat, grep, ...) skip the regex scan.
+    _TRIGGER_SUBSTRINGS = (
+        "rm", "mkfs", "dd", "format", "chmod", "chown", "su", "wget", "curl", ">",
+    )
+
     def __init__(
         self,
         sandbox_config: Optional[SandboxConfig] = None,
@@ -467,17 +543,8 @@ class BashTool:
         Returns:
             SandboxResult
         """
-        import re
-
         # Check for dangerous patterns
-        is_dangerous = False
-        danger_reason = None
-
-        for pattern, reason in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                is_dangerous = True
-                danger_reason = reason
-                break
+        is_dangerous, danger_reason = self.is_dangerous(command)
 
         # Require confirmation for dangerous commands
         if (is_dangerous or require_confirmation) and not self.allow_unsafe:
@@ -501,10 +568,12 @@ class BashTool:
         Returns:
             (is_dangerous, reason)
         """
-        import re
+        lower = command.lower()
+        if not any(trigger in lower for trigger in self._TRIGGER_SUBSTRINGS):
+            return False, None
 
-        for pattern, reason in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
+        for regex, reason in self._COMPILED_PATTERNS:
+            if regex.search(command):
                 return True, reason
 
         return False, None
@@ -14,7 +14,9 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import re
 import time
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -38,7 +40,7 @@ class ToolCategory(Enum):
     SHELL = auto()  # Shell commands, special handling
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSpec:
     """Specification for a registered tool."""
 
@@ -50,7 +52,7 @@ class ToolSpec:
     max_execution_time: float = 60.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of tool execution."""
 
@@ -64,7 +66,7 @@ class ExecutionResult:
     stderr: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context passed to tool executors."""
 
@@ -146,6 +148,9 @@ class ToolRegistry:
         ":(){ :|:& };:",  # Fork bomb
     ]
 
+    # All patterns as one escaped alternation: a single C-level scan per command.
+    _DANGEROUS_RE = re.compile("|".join(re.escape(pattern) for pattern in DANGEROUS_PATTERNS))
+
     def __init__(self):
         self._tools: dict[str, Callable[..., Any]] = {}
         self._specs: dict[str, ToolSpec] = {}
@@ -207,9 +212,8 @@ class ToolRegistry:
         # Check shell commands for dangerous patterns
         if tool_name in ("run_shell_command", "shell"):
             command = tool_input.get("command", "")
-            for pattern in self.DANGEROUS_PATTERNS:
-                if pattern in command.lower():
-                    return True
+            if self._DANGEROUS_RE.search(command.lower()):
+                return True
 
         return False
 
@@ -415,7 +419,7 @@ class ParallelToolExecutor:
         tool_name = tool_call.name
         tool_input = tool_call.input
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Yield start event
         yield ToolExecutionStartEvent(
@@ -434,7 +438,7 @@ class ParallelToolExecutor:
                     result=None,
                     is_error=True,
                     error_message=error,
-                    execution_time_ms=int((time.time() - start_time) * 1000),
+                    execution_time_ms=int((time.monotonic() - start_time) * 1000),
                 )
                 return
 
@@ -447,7 +451,7 @@ class ParallelToolExecutor:
                 result=None,
                 is_error=True,
                 error_message=f"Tool not found: {tool_name}",
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=int((time.monotonic() - start_time) * 1000),
             )
             return
 
@@ -478,10 +482,10 @@ class ParallelToolExecutor:
                     loop.run_in_executor(None, lambda: tool_callable(**tool_input)),
                     timeout=timeout,
                 )
-                if inspect.isawaitable(result):
+                if isinstance(result, Awaitable):
                     result = await asyncio.wait_for(result, timeout=timeout)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = int((time.monotonic() - start_time) * 1000)
 
             # Report completion
             self._notify_progress(tool_use_id, 100.0, "Complete")
@@ -495,7 +499,7 @@ class ParallelToolExecutor:
             )
 
         except asyncio.TimeoutError:
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = int((time.monotonic() - start_time) * 1000)
             yield ToolResultEvent(
                 tool_use_id=tool_use_id,
                 tool_name=tool_name,
@@ -506,7 +510,7 @@ class ParallelToolExecutor:
             )
 
         except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = int((time.monotonic() - start_time) * 1000)
             formatted_error = format_tool_error(tool_name, tool_input, e)
 
             yield ToolResultEvent(
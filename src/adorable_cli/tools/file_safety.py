@@ -20,6 +20,9 @@ from typing import Any, Callable, Literal, Optional
 
 from adorable_cli.utils.errors import FileSafetyError
 
+# Line-number prefixes as produced by read_file ("2\t"), "2: " or "  10  ".
+_LINE_NUMBER_PREFIX_RE = re.compile(r"^\s*\d+[:\s]")
+
 
 @dataclass
 class FileState:
@@ -272,29 +275,15 @@ class EditValidator:
         if not old_text:
             return None
 
-        # Split into lines to check each line
-        lines = old_text.split('\n')
-        problematic_lines = []
-
-        for i, line in enumerate(lines, 1):
-            if not line.strip():
-                continue
-
-            # Pattern 1: Number followed by tab (Claude Code read_file format)
-            if re.match(r'^\d+\t', line):
-                problematic_lines.append((i, line[:50]))
-                continue
-
-            # Pattern 2: Number followed by colon and optional spaces
-            if re.match(r'^\s*\d+:\s*', line):
-                problematic_lines.append((i, line[:50]))
-                continue
-
-            # Pattern 3: Number followed by spaces (at start of line)
-            if re.match(r'^\s*\d+\s+', line) and not re.match(r'^\s*\d+\.\d+', line):
-                # Exclude decimal numbers like "3.14"
-                problematic_lines.append((i, line[:50]))
-                continue
+        # One anchored pass per line covers all three patterns: "2\t" and
+        # "2  " are digits followed by whitespace, "2:" by a colon. Decimals
+        # like "3.14" never match because the digit run is followed by ".".
+        # Blank lines cannot match, so no separate strip() check is needed.
+        problematic_lines = [
+            (i, line[:50])
+            for i, line in enumerate(old_text.split("\n"), 1)
+            if _LINE_NUMBER_PREFIX_RE.match(line)
+        ]
 
         if problematic_lines:
             examples = "\n".join([
@@ -569,12 +558,14 @@ class MultiEditTool:
 
         # Phase 4: Apply all edits (with rollback on failure)
         applied: list[tuple[Path, str]] = []  # path, original_content
+        applied_paths: set[Path] = set()
         edit_results: list[EditResult] = []
 
         try:
             for edit, original, new_content in prepared_edits:
                 # Store original for potential rollback
-                if edit.path not in [p for p, _ in applied]:
+                if edit.path not in applied_paths:
+                    applied_paths.add(edit.path)
                     applied.append((edit.path, original))
 
                 # Write the file
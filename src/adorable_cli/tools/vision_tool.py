@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +11,8 @@ from agno.utils.log import logger
 from adorable_cli.settings import settings
 from adorable_cli.agent.prompts import VLM_AGENT_DESCRIPTION, VLM_AGENT_INSTRUCTIONS
 
+_SUPPORTED_IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
 
 class ImageUnderstandingTool(Toolkit):
     def __init__(self, **kwargs):
@@ -21,9 +24,11 @@ class ImageUnderstandingTool(Toolkit):
         
         # Determine VLM model ID
         self.vlm_model_id = settings.vlm_model_id or settings.model_id
-        
-        # Create dedicated VLM Agent
-        self.vlm_agent = Agent(
+
+    @cached_property
+    def vlm_agent(self) -> Agent:
+        """Dedicated VLM Agent, built on the first image analysis rather than at startup."""
+        return Agent(
             name="vlm-agent",
             model=OpenAILike(
                 id=self.vlm_model_id,
@@ -57,7 +62,7 @@ class ImageUnderstandingTool(Toolkit):
         if not path.exists():
             return f"Error: Image file not found at {path}"
         
-        if path.suffix.lower() not in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
+        if path.suffix.lower() not in _SUPPORTED_IMAGE_SUFFIXES:
             return f"Error: Unsupported image format: {path.suffix}. Supported: .jpg, .png, .webp"
         
         try:
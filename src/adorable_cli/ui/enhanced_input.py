@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from pathlib import Path
 from typing import Callable, Optional
@@ -31,6 +33,35 @@ COMMANDS = {
     "/exit": "Quit session",
 }
 
+# Input shortcuts shown by EnhancedInputSession.show_quick_help
+_QUICK_HELP_TEXT = """
+[header]Input Shortcuts[/header]
+
+[tip]Basic:[/tip]
+• [info]Enter[/info] - Submit your message
+• [info]Alt+Enter[/info] or [info]Ctrl+J[/info] - Insert newline
+• [info]Ctrl+D[/info] or 'exit' - Quit
+
+[tip]Completion:[/tip]
+• [info]@[/info] - Trigger file path completion
+• [info]/[/info] - Trigger command completion
+
+[tip]History:[/tip]
+• [info]↑/↓[/info] - Browse previous messages
+• [info]Ctrl+R[/info] - Search command history
+        """
+
+
+@functools.cache
+def _quick_help_panel() -> Panel:
+    """Build the input help panel once; its markup is parsed on first use only."""
+    return Panel(
+        Text.from_markup(_QUICK_HELP_TEXT),
+        title=Text("Input Help", style="panel_title"),
+        border_style="panel_border",
+        padding=(0, 1),
+    )
+
 
 class FilePathCompleter(Completer):
     """Activate filesystem completion only when cursor is after '@'."""
@@ -114,7 +145,9 @@ class EnhancedInputSession:
         # History
         if history_file is None:
             history_file = Path.home() / ".adorable" / "input_history"
-        history_file.parent.mkdir(parents=True, exist_ok=True)
+        # A stat is cheaper than mkdir on the usual path where the dir exists.
+        if not os.path.isdir(history_file.parent):
+            history_file.parent.mkdir(parents=True, exist_ok=True)
         self.history = FileHistory(str(history_file))
 
         # Key bindings
@@ -225,30 +258,7 @@ class EnhancedInputSession:
 
     def show_quick_help(self):
         """Show minimal, discoverable help for input shortcuts"""
-        help_text = """
-[header]Input Shortcuts[/header]
-
-[tip]Basic:[/tip]
-• [info]Enter[/info] - Submit your message
-• [info]Alt+Enter[/info] or [info]Ctrl+J[/info] - Insert newline
-• [info]Ctrl+D[/info] or 'exit' - Quit
-
-[tip]Completion:[/tip]
-• [info]@[/info] - Trigger file path completion
-• [info]/[/info] - Trigger command completion
-
-[tip]History:[/tip]
-• [info]↑/↓[/info] - Browse previous messages
-• [info]Ctrl+R[/info] - Search command history
-        """
-        self.console.print(
-            Panel(
-                help_text,
-                title=Text("Input Help", style="panel_title"),
-                border_style="panel_border",
-                padding=(0, 1),
-            )
-        )
+        self.console.print(_quick_help_panel())
 
 
 def create_enhanced_session(console: Console) -> EnhancedInputSession:
@@ -1,45 +1,88 @@
+from __future__ import annotations
+
 import os
 import asyncio
-import inspect
+import functools
+import re
+import sys
 import types
+from collections.abc import Awaitable
 from datetime import datetime
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
 from pathlib import Path
-from time import perf_counter
-from typing import Any, Callable, Dict, List
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable
 
-from rich.align import Align
-from rich.columns import Columns
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.rule import Rule
-from rich.syntax import Syntax
 from rich.text import Text
 
-from adorable_cli.console import console
+from adorable_cli.console import get_console
 from adorable_cli.settings import settings
 from adorable_cli.config import CONFIG_PATH
 from adorable_cli.ext.commands import CommandsLoader
-from adorable_cli.ui.enhanced_input import create_enhanced_session
-from adorable_cli.ui.stream_renderer import StreamRenderer
 from adorable_cli.ui.utils import detect_language_from_extension, summarize_args
 
+if TYPE_CHECKING:
+    from adorable_cli.ui.stream_renderer import StreamRenderer
+
+
+_MCP_TOOL_CLASS_NAMES = frozenset({"MCPTools", "MultiMCPTools"})
+_TRUTHY_ENV = frozenset({"1", "true", "yes", "on"})
+_FALSY_ENV = frozenset({"0", "false", "no", "off"})
+_SHOW_CAT_VALUES = frozenset({"true", "1", "yes"})
+_DELETION_WORDS = ("rm", "unlink", "trash")
+_DELETION_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\brm\b",  # rm command
+        r"\brmdir\b",  # rmdir command
+        r"\bunlink\b",  # unlink command
+        r"\btrash\b",  # trash command (macOS)
+    )
+)
+
+# Single-key answers for tool confirmation; "" is EOF and "\x04" is Ctrl+D.
+_CONFIRM_YES_KEYS = frozenset({"y", "Y", "\r", "\n"})
+_CONFIRM_NO_KEYS = frozenset({"n", "N", "", "\x04"})
+
+# Argument aliases accepted by save_file-style tools, in priority order.
+_FILE_PATH_KEYS = ("file_path", "path", "file_name", "filename")
+_CONTENT_KEYS = ("content", "contents", "text", "data", "body")
+
+# Welcome-panel cat, parsed only when the panel is shown.
+_PIXEL_SPRITE_MARKUP = r"""
+[cat_primary]      ████          ████      [/cat_primary]
+[cat_primary]      ██[/cat_primary][cat_secondary]██[/cat_secondary][cat_primary]██      ██[/cat_primary][cat_secondary]██[/cat_secondary][cat_primary]██[/cat_primary]
+[cat_primary]      ██[/cat_primary][cat_secondary]████[/cat_secondary][cat_primary]██████[/cat_primary][cat_secondary]████[/cat_secondary][cat_primary]██[/cat_primary]
+[cat_primary]    ██[/cat_primary][cat_secondary]██████████████████[/cat_secondary][cat_primary]██[/cat_primary]
+[cat_primary]    ██[/cat_primary][cat_secondary]████[/cat_secondary][cat_accent]██[/cat_accent][cat_secondary]██████[/cat_secondary][cat_accent]██[/cat_accent][cat_secondary]████[/cat_secondary][cat_primary]██[/cat_primary]
+[cat_primary]    ██[/cat_primary][cat_secondary]██████████████████[/cat_secondary][cat_primary]██[/cat_primary]
+[cat_primary]    ████[/cat_primary][cat_secondary]██████████████[/cat_secondary][cat_primary]████[/cat_primary]
+[cat_primary]        ██████████████[/cat_primary]
+"""
+
+# Stream event kinds, checked once per event in the render loop.
+_CONTENT_EVENTS = frozenset({"RunContent", "TeamRunContent"})
+_COMPLETED_EVENTS = frozenset({"RunCompleted", "TeamRunCompleted"})
+_TOOL_CALL_EVENTS = frozenset({"ToolCallStarted", "RunToolCallStarted"})
+
 
 def _is_mcp_tool(obj: Any) -> bool:
     t = type(obj)
-    if t.__name__ in {"MCPTools", "MultiMCPTools"}:
+    if t.__name__ in _MCP_TOOL_CLASS_NAMES:
         return True
     return t.__module__.startswith("agno.tools.mcp")
 
 
 async def _pin_mcp_tools_to_current_task(agent: Any) -> list[Any]:
-    if os.environ.get("ADORABLE_DISABLE_MCP", "").lower() in {"1", "true", "yes", "on"}:
+    if os.environ.get("ADORABLE_DISABLE_MCP", "").lower() in _TRUTHY_ENV:
         return []
 
     pin_setting = os.environ.get("ADORABLE_MCP_PIN_ON_STARTUP", "").lower()
-    if pin_setting in {"0", "false", "no", "off"}:
+    if pin_setting in _FALSY_ENV:
         return []
 
     tools = [t for t in getattr(agent, "tools", []) if _is_mcp_tool(t)]
@@ -57,7 +100,7 @@ async def _pin_mcp_tools_to_current_task(agent: Any) -> list[Any]:
             pinned.append(tool)
             continue
 
-        if pin_setting in {"1", "true", "yes", "on"} and hasattr(tool, "connect"):
+        if pin_setting in _TRUTHY_ENV and hasattr(tool, "connect"):
             timeout_s = float(os.environ.get("ADORABLE_MCP_CONNECT_TIMEOUT", "10.0"))
             try:
                 await asyncio.wait_for(tool.connect(force=True), timeout=timeout_s)
@@ -119,11 +162,20 @@ async def _close_pinned_mcp_tools(pinned: list[Any]) -> None:
             continue
 
 
-def print_version() -> int:
+@functools.cache
+def _package_version() -> str | None:
+    """Installed distribution version; the metadata scan runs once per process."""
     try:
-        ver = pkg_version("adorable-cli")
-        print(f"adorable-cli {ver}")
+        return pkg_version("adorable-cli")
     except PackageNotFoundError:
+        return None
+
+
+def print_version() -> int:
+    ver = _package_version()
+    if ver is not None:
+        print(f"adorable-cli {ver}")
+    else:
         # Fallback when distribution metadata is unavailable (e.g., dev runs)
         print("adorable-cli (version unknown)")
     return 0
@@ -131,12 +183,58 @@ def print_version() -> int:
 
 def _get_shell_text(targs: dict) -> str:
     """Normalize shell tool args to a single command text for checks/preview."""
-    val = targs.get("command", None)
+    val = targs.get("command")
     if val is None:
-        val = targs.get("args", None) or targs.get("argv", None)
+        val = targs.get("args") or targs.get("argv")
+    if type(val) is str:
+        return val
     if isinstance(val, (list, tuple)):
-        return " ".join(str(x) for x in val)
-    return str(val or "")
+        return " ".join(map(str, val))
+    return str(val) if val else ""
+
+
+def _first_arg(targs: dict, keys: tuple[str, ...]) -> str:
+    """Return the first non-empty value among ``keys`` as text."""
+    for key in keys:
+        val = targs.get(key)
+        if val:
+            return str(val)
+    return ""
+
+
+# Syntax highlighting pulls in Pygments, so it is imported on first preview
+# rather than by every command that imports this module.
+@functools.cache
+def _preview_lexer(lang: str) -> Any:
+    """Resolve a Pygments lexer once per language; unknown names are left to Rich."""
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(lang)
+    except ClassNotFound:
+        return lang
+
+
+@functools.cache
+def _preview_theme() -> Any:
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme("monokai")
+
+
+def _syntax_preview(code: str, lang: str) -> Any:
+    """Highlighted preview reusing the cached lexer and theme for ``lang``."""
+    from rich.syntax import Syntax
+
+    return Syntax(code, _preview_lexer(lang), theme=_preview_theme(), line_numbers=False)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Clip preview text to roughly ``limit`` characters with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return f"{text[: limit - 30]}..."
 
 
 def _looks_like_mcp_jsonrpc_error(exc: BaseException) -> bool:
@@ -159,12 +257,19 @@ def _looks_like_mcp_jsonrpc_error(exc: BaseException) -> bool:
 # Command Dispatcher Definition
 CommandCallback = Callable[[str, Any, Console, Any], bool]
 SPECIAL_COMMANDS: Dict[str, CommandCallback] = {}
-EXIT_COMMANDS = ["exit", "exit()", "quit", "q", "bye", "/exit", "/quit", "/q"]
+# First characters and longest length over all aliases, so ordinary prompts can
+# be rejected before they are lowercased.
+_COMMAND_FIRST_CHARS: set[str] = set()
+_LONGEST_COMMAND = 0
+EXIT_COMMANDS = frozenset({"exit", "exit()", "quit", "q", "bye", "/exit", "/quit", "/q"})
 
 
-def register_command(aliases: List[str], func: CommandCallback):
+def register_command(aliases: Iterable[str], func: CommandCallback):
+    global _LONGEST_COMMAND
     for alias in aliases:
         SPECIAL_COMMANDS[alias] = func
+        _COMMAND_FIRST_CHARS.add(alias[:1])
+        _LONGEST_COMMAND = max(_LONGEST_COMMAND, len(alias))
 
 
 # Command Handlers
@@ -213,10 +318,16 @@ def handle_special_command(user_input: str, enhanced_session, console: Console,
     """Handle special commands with / prefix using dispatch pattern.
     Returns True if command was handled.
     """
-    cmd = user_input.strip().lower()
-    if cmd in SPECIAL_COMMANDS:
-        return SPECIAL_COMMANDS[cmd](cmd, enhanced_session, console, agent)
-    return False
+    text = user_input.strip()
+    # Lowercasing never shortens text, so anything longer than every alias (or
+    # starting with a character no alias uses) cannot be a command.
+    if len(text) > _LONGEST_COMMAND or text[:1].lower() not in _COMMAND_FIRST_CHARS:
+        return False
+    cmd = text.lower()
+    handler = SPECIAL_COMMANDS.get(cmd)
+    if handler is None:
+        return False
+    return handler(cmd, enhanced_session, console, agent)
 
 
 def _show_commands_help(console: Console) -> None:
@@ -264,21 +375,27 @@ def _show_session_stats(console: Console) -> None:
     )
 
 
-def _is_deletion_command(cmd_text: str) -> bool:
-    """Check if a shell command contains deletion operations.
+def _is_hard_banned(lower: str) -> bool:
+    """Check a stripped, lowercased shell command against the hard-ban list.
+
+    Plain substring tests use CPython's fast string search; they measured well
+    ahead of a regex alternation (which backtracks at every position) and of
+    encoding to bytes first.
+    """
+    return "rm -rf /" in lower or " sudo " in lower or lower.startswith("sudo ")
+
+
+def _is_deletion_command(lower: str) -> bool:
+    """Check if a lowercased shell command contains deletion operations.
     
     Returns True for commands that delete files or directories:
     - rm, rmdir, unlink, trash
     """
-    patterns = [
-        r'\brm\b',      # rm command
-        r'\brmdir\b',   # rmdir command  
-        r'\bunlink\b',  # unlink command
-        r'\btrash\b',   # trash command (macOS)
-    ]
-    import re
-    lower = cmd_text.lower()
-    return any(re.search(pattern, lower) for pattern in patterns)
+    # Cheap substring scan first: every pattern below needs one of these
+    # words, so most commands never reach the regex engine.
+    if not any(word in lower for word in _DELETION_WORDS):
+        return False
+    return any(regex.search(lower) for regex in _DELETION_PATTERNS)
 
 
 def handle_tool_confirmation(tool, console: Console) -> bool:
@@ -292,6 +409,8 @@ def handle_tool_confirmation(tool, console: Console) -> bool:
     """
     tname = getattr(tool, "tool_name", None) or getattr(tool, "name", None) or "tool"
     targs = getattr(tool, "tool_args", None) or {}
+    if not isinstance(targs, dict):
+        targs = {}
 
     # Hard bans: block dangerous system-level commands regardless
     if tname == "run_shell_command":
@@ -299,15 +418,12 @@ def handle_tool_confirmation(tool, console: Console) -> bool:
         lower = cmd_text.lower().strip()
         
         # Block critical dangerous patterns
-        if "rm -rf /" in lower or " rm -rf / " in lower:
-            console.print(Text.from_markup("[error]Blocked dangerous command (hard-ban)[/error]"))
-            return False
-        if lower.startswith("sudo ") or " sudo " in lower:
+        if _is_hard_banned(lower):
             console.print(Text.from_markup("[error]Blocked dangerous command (hard-ban)[/error]"))
             return False
         
         # Auto-approve non-deletion commands
-        if not _is_deletion_command(cmd_text):
+        if not _is_deletion_command(lower):
             return True
 
     # Show preview and ask confirmation only for deletion commands
@@ -315,59 +431,33 @@ def handle_tool_confirmation(tool, console: Console) -> bool:
     header_text = Text(f"Tool: {tname}", style="tool_name")
     preview_group.append(header_text)
 
-    try:
-        if tname == "execute_python_code":
-            code = str(targs.get("code", ""))
-            code_display = code if len(code) <= 2000 else (code[:1970] + "...")
-            preview_group.append(
-                Syntax(code_display, "python", theme="monokai", line_numbers=False)
-            )
-        elif tname == "run_shell_command":
-            cmd = _get_shell_text(targs)
-            cmd_display = cmd if len(cmd) <= 1000 else (cmd[:970] + "...")
-            preview_group.append(Syntax(cmd_display, "bash", theme="monokai", line_numbers=False))
-        elif tname == "save_file":
-            file_path = str(
-                targs.get("file_path")
-                or targs.get("path")
-                or targs.get("file_name")
-                or targs.get("filename")
-                or ""
-            )
-            content = str(
-                targs.get("content")
-                or targs.get("contents")
-                or targs.get("text")
-                or targs.get("data")
-                or targs.get("body")
-                or ""
-            )
-            content_display = content if len(content) <= 2000 else (content[:1970] + "...")
-            info = (
-                Text(f"Save path: {file_path}", style="info")
-                if file_path
-                else Text("Save path not provided", style="error")
-            )
-            preview_group.append(info)
-            if content_display:
-                lang = detect_language_from_extension(file_path)
-                if lang:
-                    preview_group.append(
-                        Syntax(
-                            content_display,
-                            lang,
-                            theme="monokai",
-                            line_numbers=False,
-                        )
-                    )
-                else:
-                    preview_group.append(Text(content_display))
-        else:
-            # Generic args preview
-            summary = summarize_args(targs if isinstance(targs, dict) else {})
-            preview_group.append(Text(f"Args: {summary}", style="info"))
-    except Exception:
-        pass
+    if tname == "execute_python_code":
+        code = str(targs.get("code", ""))
+        code_display = _truncate(code, 2000)
+        preview_group.append(_syntax_preview(code_display, "python"))
+    elif tname == "run_shell_command":
+        cmd_display = _truncate(cmd_text, 1000)
+        preview_group.append(_syntax_preview(cmd_display, "bash"))
+    elif tname == "save_file":
+        file_path = _first_arg(targs, _FILE_PATH_KEYS)
+        content = _first_arg(targs, _CONTENT_KEYS)
+        content_display = _truncate(content, 2000)
+        info = (
+            Text(f"Save path: {file_path}", style="info")
+            if file_path
+            else Text("Save path not provided", style="error")
+        )
+        preview_group.append(info)
+        if content_display:
+            lang = detect_language_from_extension(file_path)
+            if lang:
+                preview_group.append(_syntax_preview(content_display, lang))
+            else:
+                preview_group.append(Text(content_display))
+    else:
+        # Generic args preview
+        summary = summarize_args(targs)
+        preview_group.append(Text(f"Args: {summary}", style="info"))
 
     console.print(
         Panel(
@@ -378,14 +468,88 @@ def handle_tool_confirmation(tool, console: Console) -> bool:
         )
     )
 
-    resp = Prompt.ask(
-        f"Confirm running tool [tool_name]{tname}[/tool_name]?",
-        choices=["y", "n"],
-        default="y",
-    )
+    question = f"Confirm running tool [tool_name]{tname}[/tool_name]?"
+    confirmed = _confirm_with_keypress(question, console)
+    if confirmed is not None:
+        return confirmed
+
+    resp = Prompt.ask(question, choices=["y", "n"], default="y")
     return resp == "y"
 
 
+def _key_input_supported() -> bool:
+    """Whether stdin is a POSIX terminal that _read_key can switch to cbreak mode."""
+    if not sys.stdin.isatty():
+        return False
+    try:
+        import termios
+    except ImportError:  # Windows: no termios
+        return False
+    try:
+        termios.tcgetattr(sys.stdin.fileno())
+    except termios.error:
+        return False
+    return True
+
+
+def _read_key() -> str | None:
+    """Read a single keypress from a POSIX terminal; None when stdin can't do that."""
+    if not sys.stdin.isatty():
+        return None
+    try:
+        import termios
+        import tty
+    except ImportError:  # Windows: no termios
+        return None
+
+    fd = sys.stdin.fileno()
+    try:
+        saved = termios.tcgetattr(fd)
+    except termios.error:
+        return None
+    try:
+        # cbreak (not raw) keeps Ctrl+C delivering KeyboardInterrupt.
+        tty.setcbreak(fd)
+        # Read whatever the key produced so multi-byte keys don't leak into the
+        # next prompt.
+        return os.read(fd, 32).decode("utf-8", errors="ignore")
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _confirm_with_keypress(question: str, console: Console) -> bool | None:
+    """Ask a y/n question answered by one key (Enter means yes, EOF/Ctrl+D no).
+
+    Returns None when single-key input isn't available, so the caller can fall
+    back to a line-based prompt.
+    """
+    # Probe before printing so a fallback doesn't leave the question dangling.
+    if not console.is_terminal or not _key_input_supported():
+        return None
+
+    prompt = Text.from_markup(question)
+    prompt.append(" [y/n]", style="prompt.choices")
+    prompt.append(" (y)", style="prompt.default")
+    prompt.append(": ")
+    console.print(prompt, end="")
+
+    while True:
+        key = _read_key()
+        if key is None:
+            console.print()
+            return None
+        first = key[:1]
+        if first in _CONFIRM_YES_KEYS:
+            confirmed = True
+        elif first in _CONFIRM_NO_KEYS:
+            confirmed = False
+        else:
+            # Like Prompt.ask with choices: ignore anything that isn't an answer.
+            continue
+        console.print("y" if confirmed else "n")
+        return confirmed
+
+
 async def process_agent_stream(
     agent,
     user_input: str,
@@ -394,14 +558,14 @@ async def process_agent_stream(
     *,
     session_id: str | None = None,
     user_id: str | None = None,
-) -> tuple[str, Any, datetime, float]:
-    """Process agent stream with tool confirmations. Returns (final_text, metrics, start_time, start_perf).
+) -> tuple[str, Any, datetime, int]:
+    """Process agent stream with tool confirmations. Returns (final_text, metrics, start_time, start_ns).
 
     Async version to support MCPTools and other async tools.
     """
     final_metrics = None
     start_at = datetime.now()
-    start_perf = perf_counter()
+    start_ns = perf_counter_ns()
 
     stream = agent.arun(
         user_input,
@@ -410,10 +574,12 @@ async def process_agent_stream(
         session_id=session_id,
         user_id=user_id,
     )
-    if inspect.isawaitable(stream):
+    if isinstance(stream, Awaitable):
         stream = await stream
 
     renderer.start_stream()
+    # Bound once: called for every streamed content delta.
+    update_content = renderer.update_content
 
     try:
         while True:
@@ -423,12 +589,14 @@ async def process_agent_stream(
                 async for event in stream:
                     etype = getattr(event, "event", "")
 
-                    if etype in ("RunContent", "TeamRunContent"):
+                    if etype in _CONTENT_EVENTS:
                         content = getattr(event, "content", "")
                         if content:
-                            renderer.update_content(content)
+                            update_content(content)
+                        # Content deltas are never pause events; skip the check.
+                        continue
 
-                    if etype in ("RunCompleted", "TeamRunCompleted"):
+                    if etype in _COMPLETED_EVENTS:
                         content = getattr(event, "content", "")
                         if content:
                             renderer.set_final_content(content)
@@ -437,7 +605,7 @@ async def process_agent_stream(
                         if metrics:
                             final_metrics = metrics
 
-                    if etype in ("ToolCallStarted", "RunToolCallStarted"):
+                    elif etype in _TOOL_CALL_EVENTS:
                         renderer.render_tool_call(event)
 
                     if getattr(event, "is_paused", False):
@@ -447,12 +615,14 @@ async def process_agent_stream(
                 for event in stream:
                     etype = getattr(event, "event", "")
 
-                    if etype in ("RunContent", "TeamRunContent"):
+                    if etype in _CONTENT_EVENTS:
                         content = getattr(event, "content", "")
                         if content:
-                            renderer.update_content(content)
+                            update_content(content)
+                        # Content deltas are never pause events; skip the check.
+                        continue
 
-                    if etype in ("RunCompleted", "TeamRunCompleted"):
+                    if etype in _COMPLETED_EVENTS:
                         content = getattr(event, "content", "")
                         if content:
                             renderer.set_final_content(content)
@@ -461,7 +631,7 @@ async def process_agent_stream(
                         if metrics:
                             final_metrics = metrics
 
-                    if etype in ("ToolCallStarted", "RunToolCallStarted"):
+                    elif etype in _TOOL_CALL_EVENTS:
                         renderer.render_tool_call(event)
 
                     if getattr(event, "is_paused", False):
@@ -489,7 +659,7 @@ async def process_agent_stream(
                     session_id=session_id,
                     user_id=user_id,
                 )
-                if inspect.isawaitable(stream):
+                if isinstance(stream, Awaitable):
                     stream = await stream
                 renderer.resume_stream()
             else:
@@ -498,72 +668,75 @@ async def process_agent_stream(
         renderer.finish_stream()
 
     final_text = renderer.get_final_text()
-    return final_text, final_metrics, start_at, start_perf
+    return final_text, final_metrics, start_at, start_ns
 
 
 async def run_interactive(agent, *, session_id: str | None = None, user_id: str | None = None) -> int:
-    # Get configuration
-    try:
-        ver = pkg_version("adorable-cli")
-    except PackageNotFoundError:
-        ver = "version unknown"
-    
+    # Resolve once: configure_console() may have rebound the shared console.
+    console = get_console()
+
+    # Layout widgets are only needed for the welcome panel.
+    from rich.align import Align
+    from rich.columns import Columns
+    from rich.rule import Rule
+
+    # Get configuration. The version and the cat toggle are only looked up by
+    # the branches below that display them.
     model_id = settings.model_id
     cwd = str(Path.cwd())
-    show_cat = os.environ.get("DEEPAGENTS_SHOW_CAT", "true").lower() in ("true", "1", "yes")
 
+    if not console.is_terminal:
+        # Piped or scripted output: skip the panel layout, keep one parseable line.
+        ver = _package_version() or "version unknown"
+        console.print(f"Adorable CLI {ver} | model={model_id} | cwd={cwd}", markup=False)
     # Claude Code-style welcome UI: two-column layout + optional pixel cat
-    if show_cat:
-        pixel_sprite = r"""
-[cat_primary]      ████          ████      [/cat_primary]
-[cat_primary]      ██[/cat_primary][cat_secondary]██[/cat_secondary][cat_primary]██      ██[/cat_primary][cat_secondary]██[/cat_secondary][cat_primary]██[/cat_primary]
-[cat_primary]      ██[/cat_primary][cat_secondary]████[/cat_secondary][cat_primary]██████[/cat_primary][cat_secondary]████[/cat_secondary][cat_primary]██[/cat_primary]
-[cat_primary]    ██[/cat_primary][cat_secondary]██████████████████[/cat_secondary][cat_primary]██[/cat_primary]
-[cat_primary]    ██[/cat_primary][cat_secondary]████[/cat_secondary][cat_accent]██[/cat_accent][cat_secondary]██████[/cat_secondary][cat_accent]██[/cat_accent][cat_secondary]████[/cat_secondary][cat_primary]██[/cat_primary]
-[cat_primary]    ██[/cat_primary][cat_secondary]██████████████████[/cat_secondary][cat_primary]██[/cat_primary]
-[cat_primary]    ████[/cat_primary][cat_secondary]██████████████[/cat_secondary][cat_primary]████[/cat_primary]
-[cat_primary]        ██████████████[/cat_primary]
-"""
+    elif os.environ.get("DEEPAGENTS_SHOW_CAT", "true").lower() in _SHOW_CAT_VALUES:
         left_group = Group(
             Align.center(Text("Welcome to Adorable CLI", style="header")),
-            Align.center(Text.from_markup(pixel_sprite)),
+            Align.center(Text.from_markup(_PIXEL_SPRITE_MARKUP)),
         )
     else:
+        ver = _package_version() or "version unknown"
         left_group = Group(
             Align.center(Text("Welcome to Adorable CLI", style="header")),
             Align.center(Text(f"\nVersion {ver}", style="info")),
         )
 
-    # Right panel: clean tips layout
-    right_group = Group(
-        Text("Quick Start", style="tip"),
-        Rule(style="rule_light"),
-        Text("• Type your question to start", style="muted"),
-        Text("• Use /help for all commands", style="muted"),
-        Text("• Ctrl+J or Alt+Enter for newline", style="muted"),
-        Text("• @ for file completion", style="muted"),
-        Text(""),
-        Text("Configuration", style="tip"),
-        Text(f"Model: {model_id}", style="muted"),
-        Text(f"Path: {cwd}", style="muted"),
-    )
-
-    console.print(
-        Panel(
-            Columns([left_group, right_group], equal=True, expand=True),
-            title=Text("Adorable CLI", style="panel_title"),
-            border_style="panel_border",
-            padding=(0, 1),
+    if console.is_terminal:
+        # Right panel: clean tips layout
+        right_group = Group(
+            Text("Quick Start", style="tip"),
+            Rule(style="rule_light"),
+            Text("• Type your question to start", style="muted"),
+            Text("• Use /help for all commands", style="muted"),
+            Text("• Ctrl+J or Alt+Enter for newline", style="muted"),
+            Text("• @ for file completion", style="muted"),
+            Text(""),
+            Text("Configuration", style="tip"),
+            Text(f"Model: {model_id}", style="muted"),
+            Text(f"Path: {cwd}", style="muted"),
         )
-    )
+        console.print(
+            Panel(
+                Columns([left_group, right_group], equal=True, expand=True),
+                title=Text("Adorable CLI", style="panel_title"),
+                border_style="panel_border",
+                padding=(0, 1),
+            )
+        )
+
+    # Create enhanced input session. prompt_toolkit is imported here, after the
+    # banner is on screen, so print_version and the welcome panel don't wait on it.
+    from adorable_cli.ui.enhanced_input import create_enhanced_session
 
-    # Create enhanced input session
     enhanced_session = create_enhanced_session(console)
 
     # Enhanced interaction loop with simplified control flow
     console.print("[success]Ready to assist[/success]")
 
     # Initialize renderer once for the session
+    from adorable_cli.ui.stream_renderer import StreamRenderer
+
     renderer = StreamRenderer(console)
 
     pinned_mcp_tools = await _pin_mcp_tools_to_current_task(agent)
@@ -602,7 +775,7 @@ async def run_interactive(agent, *, session_id: str | None = None, user_id: str
                     user_input = cmd_obj.prompt
 
             try:
-                final_text, final_metrics, start_at, start_perf = await process_agent_stream(
+                final_text, final_metrics, start_at, start_ns = await process_agent_stream(
                     agent,
                     user_input,
                     renderer,
@@ -610,7 +783,7 @@ async def run_interactive(agent, *, session_id: str | None = None, user_id: str
                     session_id=session_id,
                     user_id=user_id,
                 )
-                renderer.render_footer(final_metrics, start_at, start_perf)
+                renderer.render_footer(final_metrics, start_at, start_ns)
             except Exception as exc:
                 if _looks_like_mcp_jsonrpc_error(exc):
                     console.print(
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import re
+import threading
+import weakref
 from datetime import datetime
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Any, Optional
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.spinner import Spinner
@@ -12,6 +15,51 @@ from rich.text import Text
 
 from adorable_cli.ui.utils import summarize_args
 
+# First character of a block that is safe to freeze before: it is not an
+# indented/continued line or a list item (loose lists must stay in one Markdown
+# so their numbering and spacing are preserved). Blockquotes and tables are not
+# split off either: Rich already pads them with their own blank line.
+_BLOCK_START_RE = re.compile(r"[^\s\-*+\d>|]")
+# Opening/closing line of a fenced code block (``` or ~~~, up to 3 spaces indent).
+_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+# Link reference definitions apply to the whole document, so once one appears
+# the segment can't be rendered block by block.
+_LINK_REF_DEF_RE = re.compile(r"^ {0,3}\[[^\]\n]+\]:", re.MULTILINE)
+_BLANK_LINE = Text("")
+
+
+def _next_fence(line: str, fence: Optional[str]) -> Optional[str]:
+    """Return the fence still open after ``line``.
+
+    ``fence`` is the opening marker open before the line (or None); a fence only
+    closes on a bare marker of the same character at least as long as the opener.
+    """
+    match = _FENCE_RE.match(line)
+    if match is None:
+        return fence
+    marker = match.group(1)
+    if fence is None:
+        return marker
+    if marker[0] == fence[0] and len(marker) >= len(fence) and not line[match.end() :].strip():
+        return None
+    return fence
+
+
+class _StreamingBody:
+    """Live renderable that reads the renderer's current segment at paint time.
+
+    Live repaints on its own 10 fps timer, so deltas only need to be appended;
+    the tail is parsed when a frame is actually drawn rather than per chunk.
+    """
+
+    def __init__(self, renderer: "StreamRenderer") -> None:
+        self._renderer = weakref.ref(renderer)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        renderer = self._renderer()
+        if renderer is not None:
+            yield renderer._segment_renderable()
+
 
 class StreamRenderer:
     """
@@ -40,15 +88,46 @@ class StreamRenderer:
         # Stream state
         self.spinner: Optional[Live] = None
         self.content_live: Optional[Live] = None
-        self.segment_content = ""  # Content since last interruption
-        self.full_content = ""  # Total accumulated content
+        # Total accumulated content, kept as chunks and joined only when read.
+        self._chunks: list[str] = []
+        self._content_len = 0
+
+        # Current segment (content since last interruption), split into finished
+        # Markdown blocks that are parsed once and the still-growing tail.
+        self._stable_blocks: list[RenderableType] = []
+        self._tail = ""
+        self._tail_markdown: Optional[Markdown] = None
+        # Source text of the frozen blocks, kept in case they must be re-merged.
+        self._frozen_parts: list[str] = []
+        self._freeze_disabled = False
+        # Scan state of the tail, so each delta only scans the new lines: offset of
+        # the first unscanned line, the fence open there, and where the current
+        # run of blank lines started.
+        self._scan_pos = 0
+        self._scan_fence: Optional[str] = None
+        self._blank_run: Optional[int] = None
+        # Live paints from its refresh thread; blocks and tail change together.
+        self._segment_lock = threading.Lock()
+        self._body = _StreamingBody(self)
 
     def start_stream(self) -> None:
         """Initialize state and show thinking spinner."""
-        self.segment_content = ""
-        self.full_content = ""
+        self._chunks = []
+        self._content_len = 0
+        self._reset_segment()
         self._start_spinner()
 
+    def _reset_segment(self) -> None:
+        with self._segment_lock:
+            self._stable_blocks = []
+            self._tail = ""
+            self._tail_markdown = None
+            self._frozen_parts = []
+            self._freeze_disabled = False
+            self._scan_pos = 0
+            self._scan_fence = None
+            self._blank_run = None
+
     def _start_spinner(self) -> None:
         """Start the thinking spinner."""
         # Only start spinner if we are not currently streaming content
@@ -74,27 +153,106 @@ class StreamRenderer:
         # Stop spinner if it's running
         self._stop_spinner()
 
-        self.segment_content += delta
-        self.full_content += delta
+        self._tail += delta
+        self._chunks.append(delta)
+        self._content_len += len(delta)
+        self._freeze_finished_blocks()
 
-        # Start content live display if not running
+        # Start content live display if not running; afterwards Live's own
+        # refresh picks up the new text through _StreamingBody.
         if self.content_live is None:
             self.content_live = Live(
-                Markdown(self.segment_content),
+                self._body,
                 console=self.console,
                 transient=False,  # Content should persist
                 refresh_per_second=10,
             )
             self.content_live.start()
-        else:
-            self.content_live.update(Markdown(self.segment_content))
+
+    def _stop_content_live(self) -> None:
+        """Stop the content display; Live paints the latest text on stop."""
+        if self.content_live is None:
+            return
+        self.content_live.stop()
+        self.content_live = None
+
+    def _freeze_finished_blocks(self) -> None:
+        """Move completed Markdown blocks out of the tail so they are parsed once.
+
+        Only the last block can still change, so re-parsing the whole segment on
+        every delta is wasted work that grows with the length of the answer.
+        """
+        if self._freeze_disabled:
+            return
+        tail = self._tail
+        pos = self._scan_pos
+        if _LINK_REF_DEF_RE.search(tail, pos):
+            # Earlier blocks may use this definition: render the segment whole.
+            with self._segment_lock:
+                self._tail = "".join(self._frozen_parts) + tail
+                self._stable_blocks = []
+                self._frozen_parts = []
+                self._freeze_disabled = True
+            return
+
+        fence = self._scan_fence
+        blank_run = self._blank_run
+        split: Optional[tuple[int, int]] = None
+        # Only complete lines are consumed; a fence marker may still grow.
+        while (end := tail.find("\n", pos)) != -1:
+            line = tail[pos:end]
+            if not line:
+                if blank_run is None and pos:
+                    blank_run = pos - 1
+            else:
+                # Never split inside an open fenced code block.
+                if blank_run and fence is None and _BLOCK_START_RE.match(line):
+                    split = (blank_run, pos)
+                blank_run = None
+                fence = _next_fence(line, fence)
+            pos = end + 1
+        # The first character of a partial line already tells whether a block starts.
+        if blank_run and fence is None and _BLOCK_START_RE.match(tail, pos):
+            split = (blank_run, pos)
+            blank_run = None
+
+        if split is None:
+            self._scan_pos, self._scan_fence, self._blank_run = pos, fence, blank_run
+            return
+
+        block_end, rest = split
+        block = Markdown(tail[:block_end])
+        # Markdown separates blocks with a blank line, except after a rule.
+        needs_gap = not (block.parsed and block.parsed[-1].type == "hr")
+        with self._segment_lock:
+            self._stable_blocks.append(block)
+            if needs_gap:
+                self._stable_blocks.append(_BLANK_LINE)
+            self._frozen_parts.append(tail[:rest])
+            self._tail = tail[rest:]
+        self._scan_pos = pos - rest
+        self._scan_fence = fence
+        self._blank_run = None if blank_run is None else blank_run - rest
+
+    def _segment_renderable(self) -> RenderableType:
+        with self._segment_lock:
+            stable = tuple(self._stable_blocks)
+            tail = self._tail
+        tail_md = self._tail_markdown
+        if tail_md is None or tail_md.markup != tail:
+            # Only reparse when the tail changed since the last painted frame.
+            tail_md = self._tail_markdown = Markdown(tail)
+        if not stable:
+            return tail_md
+        return Group(*stable, tail_md)
 
     def set_final_content(self, content: str) -> None:
         """Set the final content (fallback/update)."""
-        if content and len(content) > len(self.full_content):
+        if content and len(content) > self._content_len:
             # If we missed something, append it?
             # Or just update full_content for get_final_text
-            self.full_content = content
+            self._chunks = [content]
+            self._content_len = len(content)
 
     def render_tool_call(self, event: Any) -> None:
         """Render tool call event line."""
@@ -107,33 +265,31 @@ class StreamRenderer:
         args = getattr(event, "tool_args", None) or getattr(tool, "tool_args", None) or {}
         summary = summarize_args(args if isinstance(args, dict) else {})
 
-        # Stop any active display
-        self._stop_spinner()
+        # Finish the streamed text block; a running spinner is left alone since
+        # Live prints the line above it without tearing down its refresh thread.
         if self.content_live is not None:
-            self.content_live.stop()
-            self.content_live = None
-            self.segment_content = ""  # Reset segment for next text block
+            self._stop_content_live()
+            self._reset_segment()  # Reset segment for next text block
 
-        # Print tool call
-        t = Text.from_markup(
-            f"[{self.tool_line_style}]• ToolCall: [{self.tool_name_style}]{name}[/{self.tool_name_style}]({summary})[/]"
-        )
+        # Print tool call; built directly so args containing "[" are not read as markup
+        t = Text("• ToolCall: ", style=self.tool_line_style)
+        t.append(name, style=self.tool_name_style)
+        t.append(f"({summary})")
         self.console.print(t)
 
-        # Resume spinner for next operation
+        # Resume spinner for next operation (no-op if still running)
         self._start_spinner()
 
     def pause_stream(self) -> None:
         """Pause for user interaction."""
         self._stop_spinner()
         if self.content_live is not None:
-            self.content_live.stop()
-            self.content_live = None
-            # Do NOT reset segment_content here?
+            self._stop_content_live()
+            # Do NOT reset the segment here?
             # If we pause, we might resume adding to the same segment?
             # But render_tool_call usually happens before pause (if tool needs confirmation).
             # If we pause for tool confirmation, render_tool_call has likely already been called.
-            # So segment_content is likely empty.
+            # So the segment is likely empty.
 
     def resume_stream(self) -> None:
         """Resume after interaction."""
@@ -142,9 +298,7 @@ class StreamRenderer:
     def finish_stream(self) -> None:
         """Finalize: stop all displays."""
         self._stop_spinner()
-        if self.content_live is not None:
-            self.content_live.stop()
-            self.content_live = None
+        self._stop_content_live()
 
         # Ensure final newline if needed?
         # Live(transient=False) usually leaves a newline.
@@ -153,14 +307,20 @@ class StreamRenderer:
         """Get final text."""
         return self.full_content
 
-    def handle_event(self, event: Any) -> None:
-        """Legacy method."""
-        self.render_tool_call(event)
+    @property
+    def full_content(self) -> str:
+        """Total accumulated content."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    # Legacy name, bound directly so callers skip a forwarding frame.
+    handle_event = render_tool_call
 
-    def render_footer(self, final_metrics: Any, start_at: datetime, start_perf: float) -> None:
+    def render_footer(self, final_metrics: Any, start_at: datetime, start_ns: int) -> None:
         duration_val = getattr(final_metrics, "duration", None) if final_metrics else None
         if not isinstance(duration_val, (int, float)):
-            duration_val = perf_counter() - start_perf
+            duration_val = (perf_counter_ns() - start_ns) / 1e9
 
         self.console.print(
             Text(f"Completed at {start_at:%H:%M:%S} • {duration_val:.2f}s", style="muted")
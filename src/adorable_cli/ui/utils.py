@@ -2,6 +2,24 @@ from typing import Any, Dict
 from pathlib import Path
 
 
+_LANGUAGE_BY_EXTENSION: Dict[str, str] = {
+    ".py": "python",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".json": "json",
+    ".md": "markdown",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".html": "html",
+    ".css": "css",
+}
+
+_HIDDEN_ARG_KEYS = frozenset({"api_key", "token", "password", "secret"})
+
+
 def summarize_args(args: Dict[str, Any]) -> str:
     """Create a compact, safe summary string for tool args.
 
@@ -12,15 +30,20 @@ def summarize_args(args: Dict[str, Any]) -> str:
     if not args:
         return ""
 
-    hidden_keys = {"api_key", "token", "password", "secret"}
     parts = []
+    length = -2  # no ", " before the first part
     for key, value in args.items():
-        if key in hidden_keys:
+        if key in _HIDDEN_ARG_KEYS:
             continue
-        sval = str(value)
+        sval = value if isinstance(value, str) else str(value)
         if len(sval) > 64:
             sval = sval[:61] + "..."
-        parts.append(f"{key}={sval}")
+        part = f"{key}={sval}"
+        parts.append(part)
+        length += len(part) + 2
+        if length > 100:
+            # Already past the cap; later parts would be cut off anyway.
+            break
 
     summary = ", ".join(parts)
     if len(summary) > 100:
@@ -33,18 +56,4 @@ def detect_language_from_extension(file_path: str) -> str:
         ext = Path(file_path).suffix.lower()
     except Exception:
         ext = ""
-    mapping = {
-        ".py": "python",
-        ".sh": "bash",
-        ".bash": "bash",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".json": "json",
-        ".md": "markdown",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".toml": "toml",
-        ".html": "html",
-        ".css": "css",
-    }
-    return mapping.get(ext, "")
\ No newline at end of file
+    return _LANGUAGE_BY_EXTENSION.get(ext, "")
\ No newline at end of file
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Iterable
@@ -8,6 +11,11 @@ import yaml
 
 from adorable_cli import config as cfg
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class UnknownWorkflowError(ValueError):
     """Raised when a workflow id is not found."""
@@ -29,20 +37,17 @@ class Workflow:
         return await self.runner(**kwargs)
 
 
+# Line classes counted by _summarize_diff; "+++ "/"--- " file headers are excluded.
+_DIFF_FILE_RE = re.compile(r"^diff --git.*", re.MULTILINE)
+_DIFF_ADDED_RE = re.compile(r"^\+(?!\+\+ )", re.MULTILINE)
+_DIFF_REMOVED_RE = re.compile(r"^-(?!-- )", re.MULTILINE)
+
+
 def _summarize_diff(diff_text: str) -> tuple[int, int, int]:
-    files: set[str] = set()
-    added = 0
-    removed = 0
-    for line in diff_text.splitlines():
-        if line.startswith("diff --git"):
-            files.add(line)
-            continue
-        if line.startswith("+++ ") or line.startswith("--- "):
-            continue
-        if line.startswith("+"):
-            added += 1
-        elif line.startswith("-"):
-            removed += 1
+    # Three C-level regex scans instead of a Python loop over every line.
+    files = set(_DIFF_FILE_RE.findall(diff_text))
+    added = len(_DIFF_ADDED_RE.findall(diff_text))
+    removed = len(_DIFF_REMOVED_RE.findall(diff_text))
     return len(files), added, removed
 
 
@@ -89,8 +94,9 @@ async def _run_code_review(
     return WorkflowResult(output=output)
 
 
-def _builtin_workflows() -> list[Workflow]:
-    return [
+@functools.cache
+def _builtin_workflows() -> tuple[Workflow, ...]:
+    return (
         Workflow(
             workflow_id="research",
             description="Research a question and provide a structured answer.",
@@ -103,60 +109,97 @@ def _builtin_workflows() -> list[Workflow]:
             requires_component=False,
             runner=_run_code_review,
         ),
-    ]
+    )
+
+
+@functools.cache
+def _builtin_workflows_by_id() -> dict[str, Workflow]:
+    return {wf.workflow_id: wf for wf in _builtin_workflows()}
+
+
+# Parsed custom workflow files, keyed by path with the cfg.file_stamp they were parsed at.
+_WORKFLOW_CACHE: dict[Path, tuple[tuple[int, int], Workflow | None]] = {}
 
 
 def _load_custom_workflows() -> Iterable[Workflow]:
-    workflows_dir = cfg.WORKFLOWS_DIR
-    if not workflows_dir.exists():
+    # scandir's DirEntry carries the name and d_type from the directory read, so
+    # unrelated entries are skipped without a Path or a stat call.
+    try:
+        with os.scandir(cfg.WORKFLOWS_DIR) as it:
+            entries = sorted(
+                (entry for entry in it if entry.name.lower().endswith((".yaml", ".yml"))),
+                key=lambda entry: entry.name,
+            )
+    except OSError:
         return []
 
     workflows: list[Workflow] = []
-    for path in sorted(workflows_dir.iterdir()):
-        if path.suffix.lower() not in {".yaml", ".yml"}:
+    for entry in entries:
+        if not entry.is_file():
             continue
-        try:
-            data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(data, dict):
-            continue
-        workflow_id = str(data.get("name") or path.stem).strip()
-        if not workflow_id:
-            continue
-        description = str(data.get("description") or "Custom workflow").strip()
-
-        async def _run_custom(
-            *,
-            offline: bool = False,
-            workflow_key: str = workflow_id,
-            **__: Any,
-        ) -> WorkflowResult:
-            if offline:
-                return WorkflowResult(
-                    output=f"Offline mode not supported for custom workflow '{workflow_key}' yet"
-                )
-            return WorkflowResult(output=f"Custom workflow '{workflow_key}' is not implemented yet.")
-
-        workflows.append(
-            Workflow(
-                workflow_id=workflow_id,
-                description=description,
-                requires_component=False,
-                runner=_run_custom,
-            )
-        )
+        workflow = _load_workflow_file(Path(entry.path))
+        if workflow is not None:
+            workflows.append(workflow)
     return workflows
 
 
+def _load_workflow_file(path: Path) -> Workflow | None:
+    stamp = cfg.file_stamp(path)
+    if stamp is None:
+        return None
+    cached = _WORKFLOW_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    workflow = _parse_workflow_file(path)
+    _WORKFLOW_CACHE[path] = (stamp, workflow)
+    return workflow
+
+
+def _parse_workflow_file(path: Path) -> Workflow | None:
+    try:
+        data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+    except Exception:
+        return None
+    if not isinstance(data, dict):
+        return None
+    workflow_id = str(data.get("name") or path.stem).strip()
+    if not workflow_id:
+        return None
+    description = str(data.get("description") or "Custom workflow").strip()
+
+    async def _run_custom(
+        *,
+        offline: bool = False,
+        workflow_key: str = workflow_id,
+        **__: Any,
+    ) -> WorkflowResult:
+        if offline:
+            return WorkflowResult(
+                output=f"Offline mode not supported for custom workflow '{workflow_key}' yet"
+            )
+        return WorkflowResult(output=f"Custom workflow '{workflow_key}' is not implemented yet.")
+
+    return Workflow(
+        workflow_id=workflow_id,
+        description=description,
+        requires_component=False,
+        runner=_run_custom,
+    )
+
+
 def list_workflows() -> list[Workflow]:
-    workflows = _builtin_workflows()
-    workflows.extend(list(_load_custom_workflows()))
+    workflows = list(_builtin_workflows())
+    workflows.extend(_load_custom_workflows())
     return workflows
 
 
 def get_workflow(workflow_id: str) -> Workflow:
-    for wf in list_workflows():
+    # Built-ins shadow custom files of the same name, so they need no disk scan.
+    builtin = _builtin_workflows_by_id().get(workflow_id)
+    if builtin is not None:
+        return builtin
+    for wf in _load_custom_workflows():
         if wf.workflow_id == workflow_id:
             return wf
     raise UnknownWorkflowError(f"Unknown workflow: {workflow_id}")
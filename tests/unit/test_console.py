@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from adorable_cli import console as console_mod
+
+
+def test_get_console_tracks_configure_console(monkeypatch) -> None:
+    monkeypatch.setattr(console_mod, "console", console_mod.console)
+
+    plain = console_mod.configure_console(True)
+    assert console_mod.get_console() is plain
+    assert plain.no_color
+
+    themed = console_mod.configure_console(False)
+    assert console_mod.get_console() is themed
+    assert themed is not plain
+
+
+def test_plain_console_keeps_theme_styles(monkeypatch) -> None:
+    monkeypatch.setattr(console_mod, "console", console_mod.console)
+
+    plain = console_mod.configure_console(True)
+    with plain.capture() as capture:
+        plain.print("ready", style="info")
+        plain.print("[success]done[/success]")
+    assert capture.get() == "ready\ndone\n"
+
+
+def test_configure_console_without_stdout(monkeypatch) -> None:
+    monkeypatch.setattr(console_mod, "console", console_mod.console)
+    monkeypatch.setattr(console_mod.sys, "stdout", None)
+
+    assert console_mod.configure_console(False).no_color
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date
+
+from agno.agent import Agent
+from agno.models.openai import OpenAILike
+from agno.session import AgentSession
+
+from adorable_cli.agent.main_agent import _with_current_date
+
+
+def test_current_date_lands_after_model_and_tool_instructions() -> None:
+    note = f"The current date is {date.today().isoformat()}."
+    agent = Agent(
+        model=OpenAILike(id="test-model", api_key="test"),
+        instructions=_with_current_date(["static rule"]),
+        markdown=True,
+    )
+    agent._tool_instructions = ["tool rule"]
+
+    message = agent.get_system_message(session=AgentSession(session_id="s"))
+
+    content = message.content
+    assert content.endswith(note)
+    assert content.index("static rule") < content.index("tool rule") < content.index(note)
+
+
+def test_legacy_instruction_blocks_render() -> None:
+    from adorable_cli.agent.prompts import AGENT_INSTRUCTIONS
+
+    agent = Agent(
+        model=OpenAILike(id="test-model", api_key="test"),
+        instructions=_with_current_date(AGENT_INSTRUCTIONS),
+    )
+
+    message = agent.get_system_message(session=AgentSession(session_id="s"))
+
+    assert "## Role & Identity" in message.content
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from adorable_cli import main as main_mod
+
+
+def test_fast_path_version_matches_typer(capsys) -> None:
+    result = CliRunner().invoke(main_mod.app, ["version"])
+
+    code = main_mod._dispatch_fast_path(["version"])
+
+    assert code == result.exit_code == 0
+    assert capsys.readouterr().out == result.output
+
+
+def test_fast_path_falls_through_for_other_argv() -> None:
+    assert main_mod._dispatch_fast_path([]) is None
+    assert main_mod._dispatch_fast_path(["version", "--help"]) is None
+    assert main_mod._dispatch_fast_path(["--plain", "version"]) is None
+
+
+def test_plain_flag_applies_to_env_free_commands(monkeypatch) -> None:
+    calls: list[bool] = []
+    monkeypatch.setattr(main_mod, "configure_console", calls.append)
+
+    result = CliRunner().invoke(main_mod.app, ["--plain", "version"])
+
+    assert result.exit_code == 0
+    assert calls == [True]
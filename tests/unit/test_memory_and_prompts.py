@@ -437,6 +437,13 @@ class TestPromptTemplates:
         assert "/home/user/project" in prompt
         assert "main" in prompt
 
+    def test_get_system_prompt_context_follows_static_prefix(self):
+        static = get_system_prompt()
+        prompt = get_system_prompt(context_info={"cwd": "/tmp/a"})
+
+        assert prompt.startswith(static)
+        assert get_system_prompt(context_info={"cwd": "/tmp/b"}).startswith(static)
+
     def test_get_error_prompt(self):
         prompt = get_error_prompt(
             error="File not found",
@@ -522,5 +529,23 @@ class TestPsychological:
         assert "Fix" in prompt or "parameter" in prompt.lower() or "Check" in prompt
 
 
+class TestAgentPrompt:
+    """Test the main agent instruction block."""
+
+    # Rough budget: ~4 characters per token keeps the block under ~850 tokens.
+    CHAR_BUDGET = 3400
+
+    def test_agent_prompt_within_budget(self):
+        from adorable_cli.agent.prompts import AGENT_PROMPT
+
+        assert len(AGENT_PROMPT) < self.CHAR_BUDGET
+
+    def test_agent_prompt_lists_core_tools(self):
+        from adorable_cli.agent.prompts import AGENT_PROMPT
+
+        for name in ("think", "analyze", "save_file", "run_shell_command", "run_python_code"):
+            assert name in AGENT_PROMPT
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -89,3 +89,44 @@ def test_custom_workflow_loading(tmp_path: Path, monkeypatch) -> None:
     assert "Offline mode not supported for custom workflow 'custom' yet" in result.stdout
 
 
+def test_custom_workflow_files_are_parsed_once_until_changed(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from adorable_cli.workflows import registry
+
+    _patch_config_paths(tmp_path, monkeypatch)
+    workflows_dir = tmp_path / "workflows"
+    workflows_dir.mkdir(parents=True)
+    path = workflows_dir / "custom.yaml"
+    path.write_text("name: custom\ndescription: First\n", encoding="utf-8")
+
+    parsed: list[Path] = []
+    original = registry._parse_workflow_file
+
+    def _counting_parse(p: Path):
+        parsed.append(p)
+        return original(p)
+
+    monkeypatch.setattr(registry, "_parse_workflow_file", _counting_parse)
+
+    registry.list_workflows()
+    registry.list_workflows()
+    assert parsed == [path]
+
+    path.write_text("name: custom\ndescription: Second, longer\n", encoding="utf-8")
+    descriptions = {wf.workflow_id: wf.description for wf in registry.list_workflows()}
+    assert descriptions["custom"] == "Second, longer"
+    assert parsed == [path, path]
+
+
+def test_builtin_workflow_lookup_skips_custom_scan(tmp_path: Path, monkeypatch) -> None:
+    from adorable_cli.workflows import registry
+
+    _patch_config_paths(tmp_path, monkeypatch)
+
+    def _fail_scan():
+        raise AssertionError("custom workflows should not be scanned")
+
+    monkeypatch.setattr(registry, "_load_custom_workflows", _fail_scan)
+
+    assert registry.get_workflow("research") is registry.get_workflow("research")
@@ -0,0 +1,52 @@
+"""Tests for streamed sub-agent spawning."""
+
+import asyncio
+
+from adorable_cli.tools.agent_tool import AgentTool, SubAgentConfig, SubAgentTask
+
+
+class _Parent:
+    tools: list = []
+
+
+def _task(task_id: str) -> SubAgentTask:
+    return SubAgentTask(
+        task_id,
+        f"Do {task_id}",
+        context={"k": "v"},
+        config=SubAgentConfig(f"agent-{task_id}"),
+    )
+
+
+def _deltas(tool: AgentTool, tasks: list[SubAgentTask]) -> list[str]:
+    async def collect() -> list[str]:
+        return [
+            event.delta
+            async for event in tool.spawn_streaming("parent", tasks)
+            if hasattr(event, "delta")
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_tasks_run_in_order_with_labels() -> None:
+    tool = AgentTool(_Parent())
+    running: list[str] = []
+
+    async def fake_run(agent_config, task):
+        running.append(task.task_id)
+        await asyncio.sleep(0.01 if task.task_id == "a" else 0)
+        running.remove(task.task_id)
+        assert not running, "tasks must not overlap"
+        return f"out-{task.task_id}"
+
+    tool._run_agent = fake_run
+    deltas = _deltas(tool, [_task("a"), _task("b")])
+
+    assert [d.strip()[:20] for d in deltas[:4]] == [
+        "[Starting sub-agent ",
+        "[Completed agent-a (",
+        "[Starting sub-agent ",
+        "[Completed agent-b (",
+    ]
+    assert "agent-a (a)" in deltas[0] and "agent-b (b)" in deltas[3]
@@ -304,5 +304,44 @@ class TestLinuxFallback:
             assert result.stdout.strip() == ""
 
 
+class TestProfileFile:
+    """Test sandbox profile file reuse."""
+
+    def test_profile_written_once_and_rewritten_on_change(self):
+        sandbox = BashSandbox(SandboxConfig(level=SandboxLevel.READ_ONLY))
+
+        first = sandbox._ensure_profile_file()
+        assert sandbox._ensure_profile_file() == first
+
+        sandbox.config.level = SandboxLevel.NETWORK
+        assert sandbox._ensure_profile_file() == first
+        assert "(allow network-outbound)" in first.read_text()
+
+        first.unlink()
+
+
+class TestCappedCapture:
+    """Test bounded output capture."""
+
+    def test_output_is_capped_per_stream(self):
+        config = SandboxConfig(level=SandboxLevel.UNRESTRICTED, max_output_size=100)
+        sandbox = BashSandbox(config)
+
+        result = sandbox.execute("yes hello | head -c 100000; yes err | head -c 50000 >&2")
+
+        assert result.success
+        assert result.stdout == ("hello\n" * 17)[:100]
+        assert len(result.stderr) == 100
+
+    def test_timeout_kills_process(self):
+        config = SandboxConfig(level=SandboxLevel.UNRESTRICTED, timeout_seconds=1)
+        sandbox = BashSandbox(config)
+
+        result = sandbox.execute("sleep 10")
+
+        assert result.blocked
+        assert result.block_reason == "timeout"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
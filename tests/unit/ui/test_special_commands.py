@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import io
+
+from rich.console import Console
+
+from adorable_cli.console import _APP_THEME
+from adorable_cli.ui.interactive import handle_special_command
+
+
+def test_special_commands_match_case_and_whitespace_insensitively() -> None:
+    console = Console(file=io.StringIO(), force_terminal=False, theme=_APP_THEME)
+
+    assert handle_special_command("  EXIT ", None, console, None) is True
+    assert handle_special_command("/Clear", None, console, None) is True
+    assert handle_special_command("explain this function", None, console, None) is False
+    assert handle_special_command("what does /help do?", None, console, None) is False
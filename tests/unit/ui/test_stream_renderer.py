@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+from rich.markdown import Markdown
+
+from adorable_cli.ui.stream_renderer import StreamRenderer
+
+_SAMPLE = """# Title
+
+Some paragraph with **bold**.
+
+1. one
+2. two
+
+3. three
+
+```python
+x = 1
+
+y = 2
+```
+
+- a
+- b
+
+---
+
+Final para.
+
+    indented code
+
+more text"""
+
+
+def _render(renderable) -> str:
+    console = Console(file=io.StringIO(), width=60, force_terminal=False)
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+def _stream(text: str, step: int = 3) -> StreamRenderer:
+    renderer = StreamRenderer(Console(file=io.StringIO(), force_terminal=False))
+    for i in range(0, len(text), step):
+        renderer._tail += text[i : i + step]
+        renderer._freeze_finished_blocks()
+    return renderer
+
+
+def test_incremental_blocks_render_like_full_markdown() -> None:
+    renderer = _stream(_SAMPLE)
+
+    assert renderer._stable_blocks
+    assert _render(renderer._segment_renderable()) == _render(Markdown(_SAMPLE))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Intro\n\n~~~\na\n\nb\n~~~\n\nafter",
+        "Intro\n\n````\n```\n\nstill code\n````\n\nafter",
+        "Intro\n\n  ```\na\n\nb\n  ```\n\nafter",
+        "Intro\n\n~~~\n```\n\nb\n~~~\n\nafter",
+        "Para\n\n> quote\n\nmore\n\n> another\n\nend",
+        "# H\n\n> q\n\n## H2\n\nx",
+        "See [x][r]\n\nPara\n\n[r]: http://example.com\n\nend",
+        "Intro\n\n| a | b |\n|---|---|\n| 1 | 2 |",
+        "Intro\n\n| a | b |\n|---|---|\n| 1 | 2 |\n\nAfter",
+        "\n\nLeading\n\n\n\nGap",
+    ],
+)
+def test_incremental_render_matches_full_render(text: str) -> None:
+    renderer = _stream(text, step=2)
+
+    assert _render(renderer._segment_renderable()) == _render(Markdown(text))
+
+
+def test_link_reference_definition_merges_frozen_blocks() -> None:
+    text = "See [x][r]\n\nPara\n\n[r]: http://example.com\n\nend"
+    renderer = _stream(text)
+
+    assert renderer._stable_blocks == []
+    assert renderer._tail == text
+
+
+def test_blocks_are_not_split_inside_open_fence() -> None:
+    renderer = _stream("Intro\n\n```\na\n\nb\n\nc")
+
+    assert renderer._tail.startswith("```")
+
+
+def test_streamed_deltas_are_painted_on_finish() -> None:
+    console = Console(file=io.StringIO(), width=60, force_terminal=False)
+    renderer = StreamRenderer(console)
+
+    renderer.start_stream()
+    for word in ("alpha ", "beta ", "gamma ", "omega"):
+        renderer.update_content(word)
+    renderer.finish_stream()
+
+    assert "alpha beta gamma omega" in console.file.getvalue()
+
+
+def test_final_text_joins_chunks_and_prefers_longer_final_content() -> None:
+    renderer = StreamRenderer(Console(file=io.StringIO(), force_terminal=False))
+    renderer.start_stream()
+    renderer.update_content("Hello, ")
+    renderer.update_content("world")
+    renderer.finish_stream()
+
+    assert renderer.get_final_text() == "Hello, world"
+
+    renderer.set_final_content("Hello")
+    assert renderer.get_final_text() == "Hello, world"
+    renderer.set_final_content("Hello, world!")
+    assert renderer.get_final_text() == "Hello, world!"
+
+
+def test_consecutive_tool_calls_keep_the_spinner_running() -> None:
+    console = Console(file=io.StringIO(), width=60, force_terminal=False)
+    renderer = StreamRenderer(console)
+    renderer.start_stream()
+    spinner = renderer.spinner
+
+    for name in ("read_file", "list_files"):
+        tool = SimpleNamespace(tool_name=name, tool_args={"path": "a.py"})
+        renderer.render_tool_call(SimpleNamespace(event="ToolCallStarted", tool=tool))
+    assert renderer.spinner is spinner
+    renderer.finish_stream()
+
+    output = console.file.getvalue()
+    assert "ToolCall: read_file(path=a.py)" in output
+    assert "ToolCall: list_files(path=a.py)" in output
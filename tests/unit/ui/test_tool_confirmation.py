@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import io
+import sys
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from adorable_cli.console import _APP_THEME
+from adorable_cli.ui.interactive import handle_tool_confirmation
+
+
+def _shell(command: str) -> SimpleNamespace:
+    return SimpleNamespace(tool_name="run_shell_command", tool_args={"command": command})
+
+
+@pytest.mark.parametrize(
+    "command",
+    ["rm -rf /", "echo hi && RM -RF /etc", "sudo apt update", "  SUDO ls", "ls; echo x sudo y"],
+)
+def test_hard_banned_commands_are_blocked(command: str) -> None:
+    console = Console(file=io.StringIO(), force_terminal=False)
+
+    assert handle_tool_confirmation(_shell(command), console) is False
+    assert "hard-ban" in console.file.getvalue()
+
+
+@pytest.mark.parametrize("command", ["ls -la", "echo pseudo sudoers", "cat /etc/sudo.conf"])
+def test_safe_commands_are_auto_approved(command: str) -> None:
+    console = Console(file=io.StringIO(), force_terminal=False)
+
+    assert handle_tool_confirmation(_shell(command), console) is True
+    assert "Confirm running tool" not in console.file.getvalue()
+
+
+def test_save_file_preview_uses_first_non_empty_alias(monkeypatch) -> None:
+    console = Console(file=io.StringIO(), force_terminal=False, width=100, theme=_APP_THEME)
+    monkeypatch.setattr("adorable_cli.ui.interactive.Prompt.ask", lambda *a, **k: "y")
+    tool = SimpleNamespace(
+        tool_name="save_file",
+        tool_args={"file_path": "", "path": "notes.txt", "contents": "hello"},
+    )
+
+    assert handle_tool_confirmation(tool, console) is True
+    output = console.file.getvalue()
+    assert "Save path: notes.txt" in output
+    assert "hello" in output
+
+
+def test_deletion_preview_reuses_cached_lexer(monkeypatch) -> None:
+    from adorable_cli.ui import interactive
+
+    console = Console(file=io.StringIO(), force_terminal=False, width=100, theme=_APP_THEME)
+    monkeypatch.setattr("adorable_cli.ui.interactive.Prompt.ask", lambda *a, **k: "n")
+
+    for path in ("a.txt", "b.txt"):
+        assert handle_tool_confirmation(_shell(f"rm {path}"), console) is False
+
+    assert "rm b.txt" in console.file.getvalue()
+    assert interactive._preview_lexer.cache_info().currsize >= 1
+    assert interactive._preview_lexer("bash") is interactive._preview_lexer("bash")
+
+
+def test_non_dict_args_fall_back_to_empty_preview(monkeypatch) -> None:
+    console = Console(file=io.StringIO(), force_terminal=False, width=100, theme=_APP_THEME)
+    monkeypatch.setattr("adorable_cli.ui.interactive.Prompt.ask", lambda *a, **k: "y")
+    tool = SimpleNamespace(tool_name="custom_tool", tool_args="not-a-dict")
+
+    assert handle_tool_confirmation(tool, console) is True
+    assert "Args: " in console.file.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [
+        (["\r"], True),
+        (["Y"], True),
+        (["n"], False),
+        ([""], False),
+        (["\x04"], False),
+        (["x", "\x1b[A", " ", "y"], True),
+        (["\x1b", "n"], False),
+    ],
+)
+def test_single_keypress_confirmation(monkeypatch, keys: list[str], expected: bool) -> None:
+    from adorable_cli.ui import interactive
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=100, theme=_APP_THEME)
+    pending = iter(keys)
+    monkeypatch.setattr(interactive, "_key_input_supported", lambda: True)
+    monkeypatch.setattr(interactive, "_read_key", lambda: next(pending))
+
+    def _no_line_prompt(*args, **kwargs):
+        raise AssertionError("line prompt should not be used")
+
+    monkeypatch.setattr("adorable_cli.ui.interactive.Prompt.ask", _no_line_prompt)
+
+    assert handle_tool_confirmation(_shell("rm notes.txt"), console) is expected
+    assert "[y/n]" in console.file.getvalue()
+    assert next(pending, None) is None
+
+
+def test_keypress_fallback_prints_question_once(monkeypatch) -> None:
+    from adorable_cli.ui import interactive
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=100, theme=_APP_THEME)
+    monkeypatch.setattr(interactive.sys, "stdin", SimpleNamespace(isatty=lambda: True))
+    monkeypatch.setitem(sys.modules, "termios", None)  # as on Windows
+    monkeypatch.setattr("adorable_cli.ui.interactive.Prompt.ask", lambda *a, **k: "n")
+
+    assert handle_tool_confirmation(_shell("rm notes.txt"), console) is False
+    assert "Confirm running tool" not in console.file.getvalue()
+
+
+def _fake_tty(monkeypatch, read):
+    from adorable_cli.ui import interactive
+
+    calls: list[tuple] = []
+
+    class _Termios:
+        error = OSError
+        TCSADRAIN = 1
+
+        @staticmethod
+        def tcgetattr(fd):
+            calls.append(("get", fd))
+            return ["saved"]
+
+        @staticmethod
+        def tcsetattr(fd, when, attrs):
+            calls.append(("set", fd, when, attrs))
+
+    tty = SimpleNamespace(setcbreak=lambda fd: calls.append(("cbreak", fd)))
+    monkeypatch.setitem(sys.modules, "termios", _Termios)
+    monkeypatch.setitem(sys.modules, "tty", tty)
+    monkeypatch.setattr(interactive.sys, "stdin", SimpleNamespace(isatty=lambda: True, fileno=lambda: 7))
+    monkeypatch.setattr(interactive.os, "read", read)
+    return calls
+
+
+def test_read_key_restores_terminal(monkeypatch) -> None:
+    from adorable_cli.ui.interactive import _read_key
+
+    calls = _fake_tty(monkeypatch, lambda fd, n: "\x1b[A".encode())
+
+    assert _read_key() == "\x1b[A"
+    assert calls == [("get", 7), ("cbreak", 7), ("set", 7, 1, ["saved"])]
+
+
+def test_read_key_restores_terminal_on_interrupt(monkeypatch) -> None:
+    from adorable_cli.ui.interactive import _read_key
+
+    def _interrupt(fd, n):
+        raise KeyboardInterrupt
+
+    calls = _fake_tty(monkeypatch, _interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        _read_key()
+    assert calls[-1] == ("set", 7, 1, ["saved"])
+
+
+def test_read_key_without_tty(monkeypatch) -> None:
+    from adorable_cli.ui import interactive
+
+    monkeypatch.setattr(interactive.sys, "stdin", SimpleNamespace(isatty=lambda: False))
+
+    assert interactive._read_key() is None